@@ -0,0 +1,157 @@
+"""
+백엔드 cold start 측정 - 새 uvicorn 프로세스를 띄우고 준비(ready)까지의 시간과 첫 요청 지연을 잰다.
+
+    cd find-hallucination-back
+    python -m benchmarks.cold_start --runs 3 --latency 0.3 --ready-budget 10 --out cold_start.json
+    python -m benchmarks.cold_start --provider bedrock --runs 1 --prefill-keywords 30
+
+run마다 빈 임시 디렉터리(DB/캐시)로 새 프로세스를 띄우고
+- listen: 프로세스 시작 -> 첫 HTTP 응답 (GET /api/ready, 상태 코드 무관)
+- ready : 프로세스 시작 -> GET /api/ready 200
+- first / second: ready 이후 GET /api/keywords, POST /api/problem, POST /api/rankings, GET /api/rankings 의
+  첫 번째·두 번째 호출 지연 (첫 호출이 준비 비용을 떠안지 않았는지 비교)
+과 warm-up 단계별 시간을 출력한다.
+ready 중앙값이 --ready-budget(초)을 넘거나 ready가 되지 않으면 exit code 1 (CI에서 그대로 사용)
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.load_test import git_revision
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_env(args, workdir: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "LLM_PROVIDER": args.provider,
+        "LOCAL_LLM_LATENCY": str(args.latency),
+        "RANKINGS_DB_PATH": os.path.join(workdir, "rankings.db"),
+        "PROBLEM_CACHE_PATH": os.path.join(workdir, "problem_cache.db"),
+        "WARMUP_BLOCKING": "true" if args.blocking else "false",
+        "WARMUP_PREFILL_KEYWORDS": str(args.prefill_keywords),
+        "WARMUP_PREFILL_PROBLEMS": str(args.prefill_problems),
+        "TRACING_ENABLED": "false",
+    })
+    return env
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    response = func(*args, **kwargs)
+    return response, round((time.perf_counter() - start) * 1000, 1)
+
+
+def first_requests(client: httpx.Client) -> dict:
+    latencies = {}
+    for attempt in ("first", "second"):
+        response, latencies[f"GET /api/keywords {attempt}_ms"] = timed(client.get, "/api/keywords")
+        keywords = response.json().get("keywords") or ["상식"]
+        _, latencies[f"POST /api/problem {attempt}_ms"] = timed(
+            client.post, "/api/problem", json={"keyword": keywords[0]})
+        _, latencies[f"POST /api/rankings {attempt}_ms"] = timed(
+            client.post, "/api/rankings", json={"nickname": "cold", "keyword": keywords[0], "elapsed_time": 42.0})
+        _, latencies[f"GET /api/rankings {attempt}_ms"] = timed(client.get, "/api/rankings")
+    return latencies
+
+
+def run_once(args) -> dict:
+    port = free_port()
+    with tempfile.TemporaryDirectory() as workdir:
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env=server_env(args, workdir),
+        )
+        result = {"listen_s": None, "ready_s": None}
+        try:
+            with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=args.timeout) as client:
+                deadline = start + args.ready_timeout
+                while time.perf_counter() < deadline and server.poll() is None:
+                    try:
+                        response = client.get("/api/ready")
+                    except httpx.TransportError:
+                        time.sleep(0.02)
+                        continue
+                    elapsed = round(time.perf_counter() - start, 3)
+                    if result["listen_s"] is None:
+                        result["listen_s"] = elapsed
+                    if response.status_code == 200:
+                        result["ready_s"] = elapsed
+                        result["warmup"] = response.json()
+                        break
+                    time.sleep(0.02)
+
+                if result["ready_s"] is not None:
+                    result.update(first_requests(client))
+        finally:
+            server.terminate()
+            server.wait(10)
+    return result
+
+
+def summarize(runs: list) -> dict:
+    summary = {}
+    for key in runs[0]:
+        values = [run[key] for run in runs if isinstance(run.get(key), (int, float))]
+        if values:
+            summary[key] = {"median": round(statistics.median(values), 3), "max": round(max(values), 3)}
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 cold start 측정")
+    parser.add_argument("--provider", default="local", choices=["local", "bedrock"])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.3, help="local 공급자의 호출당 지연(초)")
+    parser.add_argument("--blocking", action="store_true", help="WARMUP_BLOCKING=true로 실행")
+    parser.add_argument("--prefill-keywords", type=int, default=0)
+    parser.add_argument("--prefill-problems", type=int, default=0)
+    parser.add_argument("--ready-timeout", type=float, default=120.0)
+    parser.add_argument("--ready-budget", type=float, default=0.0, help="ready 중앙값 예산(초), 0이면 검사 안 함")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    runs = [run_once(args) for _ in range(args.runs)]
+    report = {
+        "revision": git_revision(),
+        "timestamp": time.time(),
+        "config": vars(args),
+        "summary": summarize(runs),
+        "runs": runs,
+    }
+
+    failures = []
+    if any(run["ready_s"] is None for run in runs):
+        failures.append("server did not become ready")
+    elif args.ready_budget and report["summary"]["ready_s"]["median"] > args.ready_budget:
+        failures.append(f"ready {report['summary']['ready_s']['median']}s > {args.ready_budget}s")
+    report["failures"] = failures
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
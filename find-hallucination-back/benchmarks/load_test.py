@@ -0,0 +1,230 @@
+"""
+백엔드 부하 테스트 - local LLM 공급자(llm_providers.LocalProvider)로 AWS 없이 실행
+
+    cd find-hallucination-back
+    pip install -r benchmarks/requirements.txt
+    python -m benchmarks.load_test --players 50 --rounds 2 --latency 1.0 --jitter 0.3 --out result.json
+
+가상 플레이어 players명이 동시에 rounds번씩
+GET /api/keywords -> POST /api/problem -> POST /api/rankings -> GET /api/rankings 순으로 호출하고,
+엔드포인트별 처리량(req/s)과 p50/p95/p99 지연 시간, SQLite lock 에러 수를 출력한다.
+lock 에러 수는 서버의 /metrics (find_hallucination_sqlite_lock_errors_total) 전후 차이로 계산하므로
+--url로 띄워 둔 서버에도 그대로 적용된다. /metrics에 이 값이 없는 서버라면
+POST /api/rankings의 5xx 응답 수로 대신하고 sqlite_lock_errors_source에 표시한다.
+--out 으로 저장한 JSON은 리비전 간 비교에 사용한다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Optional
+
+import httpx
+
+
+def percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.server_errors = defaultdict(int)
+
+    async def call(self, name: str, request):
+        start = time.perf_counter()
+        try:
+            response = await request
+            if response.status_code >= 400:
+                self.errors[name] += 1
+            if response.status_code >= 500:
+                self.server_errors[name] += 1
+            return response
+        except Exception:
+            # in-process(ASGITransport)에서는 서버 예외가 그대로 올라온다 (원격이면 500 응답)
+            self.errors[name] += 1
+            self.server_errors[name] += 1
+        finally:
+            self.latencies[name].append(time.perf_counter() - start)
+        return None
+
+    def summary(self, wall: float) -> dict:
+        endpoints = {}
+        for name, values in self.latencies.items():
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "throughput_rps": round(len(values) / wall, 2) if wall else 0.0,
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+                "max_ms": round(max(values) * 1000, 1),
+            }
+        return endpoints
+
+
+LOCK_ERRORS_METRIC = "find_hallucination_sqlite_lock_errors_total"
+
+
+async def read_lock_errors(client: httpx.AsyncClient) -> Optional[float]:
+    """
+    서버 /metrics의 SQLite lock 에러 누적 수. 읽을 수 없거나 메트릭이 없으면 None.
+    """
+    try:
+        response = await client.get("/metrics")
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    values = [
+        float(line.rsplit(" ", 1)[1])
+        for line in response.text.splitlines()
+        if line.startswith(LOCK_ERRORS_METRIC)
+    ]
+    # 아직 한 번도 증가하지 않았으면 샘플 줄 없이 HELP/TYPE만 있다
+    if not values and f"# TYPE {LOCK_ERRORS_METRIC}" not in response.text:
+        return None
+    return sum(values)
+
+
+async def player(client: httpx.AsyncClient, recorder: Recorder, player_id: int, rounds: int):
+    for _ in range(rounds):
+        response = await recorder.call("GET /api/keywords", client.get("/api/keywords"))
+        keywords = response.json().get("keywords") if response is not None and response.status_code == 200 else None
+        keyword = random.choice(keywords) if keywords else "상식"
+
+        await recorder.call("POST /api/problem", client.post("/api/problem", json={"keyword": keyword}))
+        await recorder.call("POST /api/rankings", client.post("/api/rankings", json={
+            "nickname": f"player{player_id}",
+            "keyword": keyword,
+            "elapsed_time": random.uniform(5, 300),
+        }))
+        await recorder.call("GET /api/rankings", client.get("/api/rankings"))
+
+
+def load_app(args, workdir: str):
+    """
+    local LLM 공급자와 임시 DB를 사용하도록 설정한 뒤 main 앱을 불러온다.
+    """
+    os.environ["LLM_PROVIDER"] = "local"
+    os.environ["LOCAL_LLM_LATENCY"] = str(args.latency)
+    os.environ["LOCAL_LLM_JITTER"] = str(args.jitter)
+    os.environ["LOCAL_LLM_TOKENS_PER_SEC"] = str(args.tokens_per_sec)
+    os.environ["LOCAL_LLM_FAILURE_RATE"] = str(args.failure_rate)
+    os.environ["RANKINGS_DB_PATH"] = os.path.join(workdir, "rankings.db")
+    os.environ["PROBLEM_CACHE_PATH"] = os.path.join(workdir, "problem_cache.db")
+    os.environ["PROBLEM_POOL_ENABLED"] = "true" if args.pool else "false"
+    os.environ["PROBLEM_CACHE_ENABLED"] = "true" if args.cache else "false"
+
+    import main
+    return main.app
+
+
+async def run(args) -> dict:
+    recorder = Recorder()
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.url:
+            client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+            lifespan = None
+        else:
+            app = load_app(args, workdir)
+            transport = httpx.ASGITransport(app=app)
+            client = httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout)
+            lifespan = app.router.lifespan_context(app)
+
+        async with client:
+            if lifespan is not None:
+                await lifespan.__aenter__()
+            try:
+                lock_errors_before = await read_lock_errors(client)
+                start = time.perf_counter()
+                await asyncio.gather(*(player(client, recorder, i, args.rounds) for i in range(args.players)))
+                wall = time.perf_counter() - start
+                lock_errors_after = await read_lock_errors(client)
+            finally:
+                if lifespan is not None:
+                    await lifespan.__aexit__(None, None, None)
+
+    total = sum(len(v) for v in recorder.latencies.values())
+    if lock_errors_before is not None and lock_errors_after is not None:
+        lock_errors = int(lock_errors_after - lock_errors_before)
+        lock_errors_source = "metrics"
+    else:
+        lock_errors = recorder.server_errors["POST /api/rankings"]
+        lock_errors_source = "http_5xx"
+    return {
+        "revision": git_revision(),
+        "timestamp": time.time(),
+        "config": {
+            "target": args.url or "in-process",
+            "players": args.players,
+            "rounds": args.rounds,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "tokens_per_sec": args.tokens_per_sec,
+            "failure_rate": args.failure_rate,
+            "pool": args.pool,
+            "cache": args.cache,
+        },
+        "wall_seconds": round(wall, 3),
+        "total_requests": total,
+        "throughput_rps": round(total / wall, 2) if wall else 0.0,
+        "sqlite_lock_errors": lock_errors,
+        "sqlite_lock_errors_source": lock_errors_source,
+        "endpoints": recorder.summary(wall),
+    }
+
+
+def print_table(result: dict):
+    print(f"revision {result['revision']}  wall {result['wall_seconds']}s  "
+          f"total {result['throughput_rps']} req/s  "
+          f"sqlite lock errors {result['sqlite_lock_errors']} ({result['sqlite_lock_errors_source']})")
+    print(f"{'endpoint':<22}{'req':>6}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for name, s in sorted(result["endpoints"].items()):
+        print(f"{name:<22}{s['requests']:>6}{s['errors']:>6}{s['throughput_rps']:>9}"
+              f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['max_ms']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=20, help="동시 가상 플레이어 수")
+    parser.add_argument("--rounds", type=int, default=2, help="플레이어당 반복 횟수")
+    parser.add_argument("--latency", type=float, default=0.5, help="local LLM 평균 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="local LLM 지연 편차(초)")
+    parser.add_argument("--tokens-per-sec", type=float, default=0.0, help="local LLM 출력 속도 (0이면 제한 없음)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="local LLM 실패 확률")
+    parser.add_argument("--pool", action="store_true", help="문제 풀 사용")
+    parser.add_argument("--cache", action="store_true", help="문제 디스크 캐시 사용")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (생략 시 in-process로 실행)")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_table(result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0 if not any(s["errors"] for s in result["endpoints"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
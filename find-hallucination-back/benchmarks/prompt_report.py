@@ -0,0 +1,134 @@
+"""
+프롬프트 버전 비교 리포트 (입력/출력 토큰, 지연 시간, 검증 통과율)
+
+    cd find-hallucination-back
+    python -m benchmarks.prompt_report --samples 5                      # local 공급자 (AWS 불필요)
+    python -m benchmarks.prompt_report --provider bedrock --samples 5 --out prompt_report.json
+
+prompt_registry에 등록된 right_text / wrong_text의 모든 버전을 같은 키워드(와 같은 right_text)로
+samples번씩 호출하고 버전별 평균 토큰 수와 p50/p95 지연, 검증 실패 수를 출력한다.
+local 공급자의 토큰 수는 글자 수 기반 추정치이므로 입력 크기 비교용으로만 본다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.load_test import git_revision, percentile
+
+DEFAULT_KEYWORDS = ["우주 탐사", "르네상스", "반도체", "심해 생물", "클래식 음악"]
+
+
+def load_main(args, workdir: str):
+    os.environ["LLM_PROVIDER"] = args.provider
+    os.environ["RANKINGS_DB_PATH"] = os.path.join(workdir, "rankings.db")
+    os.environ["PROBLEM_CACHE_PATH"] = os.path.join(workdir, "problem_cache.db")
+    os.environ["PROBLEM_POOL_ENABLED"] = "false"
+    os.environ["KEYWORD_POOL_ENABLED"] = "false"
+    os.environ["TRACING_ENABLED"] = "false"
+    # 버전 비교가 목적이므로 모델 escalation 없이 한 모델로만 호출
+    os.environ["MODEL_ROUTING_ENABLED"] = "false"
+
+    import main
+    return main
+
+
+async def measure(main, name: str, prompt, inputs_list, validate_for, model: str) -> dict:
+    operation = f"report_{name}"
+    latencies, failures, results = [], 0, []
+    for inputs in inputs_list:
+        chain = main.chain_registry.get_prompt_chain(prompt, model=model, temperature=0.7)
+        start = time.perf_counter()
+        try:
+            result = await main.invoke_chain(chain, inputs, operation=operation, prompt_version=prompt.label)
+        except Exception as e:
+            result = None
+            print(f"  {prompt.label} error: {e}", file=sys.stderr)
+        latencies.append(time.perf_counter() - start)
+        if result is None or validate_for(inputs)(result):
+            failures += 1
+        results.append(result)
+
+    rendered = await chain.first.ainvoke(inputs_list[0])
+    tokens = main.llm_call_tokens
+    calls = tokens.count(operation=operation, prompt_version=prompt.label, type="input")
+    return {
+        "prompt": prompt.label,
+        "cacheable": prompt.cacheable,
+        "samples": len(inputs_list),
+        "failures": failures,
+        "prompt_chars": len(rendered.to_string()),
+        "avg_input_tokens": round(tokens.sum(operation=operation, prompt_version=prompt.label, type="input")
+                                  / calls, 1) if calls else 0.0,
+        "avg_output_tokens": round(tokens.sum(operation=operation, prompt_version=prompt.label, type="output")
+                                   / calls, 1) if calls else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "results": results,
+    }
+
+
+async def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_main(args, workdir)
+        model = main.BedrockChatModel[args.model].value
+        keywords = (args.keywords or DEFAULT_KEYWORDS)[:args.samples]
+        keywords = (keywords * args.samples)[:args.samples]
+
+        reports = []
+        right_inputs = [{"keyword": keyword} for keyword in keywords]
+        for version in main.prompt_registry.versions("right_text"):
+            prompt = main.prompt_registry.get("right_text", version)
+            reports.append(await measure(main, "right_text", prompt, right_inputs,
+                                         lambda inputs: main.validate_right_text, model))
+
+        # wrong_text는 모든 버전에 같은 right_text를 입력으로 사용
+        right_texts = [r["right_text"] for r in reports[0]["results"] if isinstance(r, dict) and r.get("right_text")]
+        if right_texts:
+            wrong_inputs = [{"right_text": right_texts[i % len(right_texts)]} for i in range(args.samples)]
+            for version in main.prompt_registry.versions("wrong_text"):
+                prompt = main.prompt_registry.get("wrong_text", version)
+                reports.append(await measure(main, "wrong_text", prompt, wrong_inputs,
+                                             lambda inputs: main.validate_wrong_text(inputs["right_text"]), model))
+
+    for report in reports:
+        report.pop("results")
+    return {
+        "revision": git_revision(),
+        "timestamp": time.time(),
+        "config": {"provider": args.provider, "model": model, "samples": args.samples},
+        "prompts": reports,
+    }
+
+
+def print_table(result: dict):
+    print(f"revision {result['revision']}  provider {result['config']['provider']}  model {result['config']['model']}")
+    print(f"{'prompt':<24}{'cache':>6}{'chars':>8}{'in_tok':>9}{'out_tok':>9}{'p50':>9}{'p95':>9}{'fail':>6}")
+    for r in result["prompts"]:
+        print(f"{r['prompt']:<24}{'y' if r['cacheable'] else 'n':>6}{r['prompt_chars']:>8}"
+              f"{r['avg_input_tokens']:>9}{r['avg_output_tokens']:>9}{r['p50_ms']:>9}{r['p95_ms']:>9}"
+              f"{r['failures']:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", default="local", choices=["local", "bedrock"])
+    parser.add_argument("--model", default="NOVA_PRO", choices=["NOVA_PRO", "NOVA_MICRO"])
+    parser.add_argument("--samples", type=int, default=5, help="버전별 호출 횟수")
+    parser.add_argument("--keywords", nargs="*", help="사용할 키워드 (기본: 고정 목록)")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_table(result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+랭킹 저장 벤치마크 - 동시 제출 상황에서 초당 쓰기 수(writes/sec) 비교
+
+    cd find-hallucination-back
+    python -m benchmarks.rankings_bench --writes 2000 --concurrency 1 4 16
+
+- legacy: 요청마다 connect + 전체 SELECT + 한 건씩 DELETE 하던 기존 구현
+- store : RankingsStore (연결 유지, WAL, 인덱스, DELETE 한 번으로 정리)
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rankings_store import RankingsStore
+
+
+def legacy_init(path: str):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS rankings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nickname TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            elapsed_time REAL NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.commit()
+    conn.close()
+
+
+def legacy_save(path: str, nickname: str, keyword: str, elapsed_time: float):
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO rankings (nickname, keyword, elapsed_time) VALUES (?, ?, ?)",
+                   (nickname, keyword, elapsed_time))
+    conn.commit()
+    cursor.execute("SELECT id FROM rankings ORDER BY elapsed_time ASC")
+    rows = cursor.fetchall()
+    if len(rows) > 10:
+        for row in rows[10:]:
+            cursor.execute("DELETE FROM rankings WHERE id = ?", (row[0],))
+        conn.commit()
+    conn.close()
+
+
+def run(name: str, save, writes: int, concurrency: int) -> dict:
+    errors = 0
+
+    def submit(i: int):
+        nonlocal errors
+        try:
+            save(f"player{i}", "ChatGPT", random.uniform(5, 120))
+        except sqlite3.OperationalError:
+            errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(submit, range(writes)))
+    elapsed = time.perf_counter() - start
+    return {
+        "impl": name,
+        "concurrency": concurrency,
+        "writes": writes,
+        "seconds": round(elapsed, 4),
+        "writes_per_sec": round(writes / elapsed, 1),
+        "lock_errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for concurrency in args.concurrency:
+            legacy_path = os.path.join(tmp, f"legacy_{concurrency}.db")
+            legacy_init(legacy_path)
+            results.append(run(
+                "legacy",
+                lambda n, k, t: legacy_save(legacy_path, n, k, t),
+                args.writes,
+                concurrency,
+            ))
+
+            store = RankingsStore(os.path.join(tmp, f"store_{concurrency}.db"))
+            store.open()
+            results.append(run("store", store.save, args.writes, concurrency))
+            store.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'impl':<8}{'conc':>6}{'writes':>8}{'sec':>10}{'writes/s':>12}{'lock_err':>10}")
+    for r in results:
+        print(f"{r['impl']:<8}{r['concurrency']:>6}{r['writes']:>8}{r['seconds']:>10}"
+              f"{r['writes_per_sec']:>12}{r['lock_errors']:>10}")
+
+
+if __name__ == "__main__":
+    main()
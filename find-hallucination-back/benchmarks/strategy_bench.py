@@ -0,0 +1,127 @@
+"""
+문제 생성 전략 비교 (split: right_text/wrong_text 두 번 호출, combined: 한 번 호출 + 잘림 시 fallback)
+
+    cd find-hallucination-back
+    python -m benchmarks.strategy_bench --problems 20 --latency 0.8 --tokens-per-sec 80 --malformed-rate 0.1
+    python -m benchmarks.strategy_bench --provider bedrock --problems 10 --out strategy.json
+
+전략마다 같은 키워드 목록으로 문제를 생성하고 end-to-end p50/p95/max 지연, 실패율,
+combined의 fallback 비율(wrong_text만 다시 생성 / split으로 다시 생성)을 출력한다.
+local 공급자에서는 --latency(첫 토큰 지연)와 --tokens-per-sec(출력 속도)로 호출 비용을,
+--malformed-rate로 출력 잘림을 흉내 낸다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.load_test import git_revision, percentile
+from benchmarks.prompt_report import DEFAULT_KEYWORDS
+
+
+def load_main(args, workdir: str):
+    os.environ["LLM_PROVIDER"] = args.provider
+    os.environ["LOCAL_LLM_LATENCY"] = str(args.latency)
+    os.environ["LOCAL_LLM_TOKENS_PER_SEC"] = str(args.tokens_per_sec)
+    os.environ["LOCAL_LLM_MALFORMED_RATE"] = str(args.malformed_rate)
+    os.environ["RANKINGS_DB_PATH"] = os.path.join(workdir, "rankings.db")
+    os.environ["PROBLEM_CACHE_PATH"] = os.path.join(workdir, "problem_cache.db")
+    os.environ["PROBLEM_POOL_ENABLED"] = "false"
+    os.environ["KEYWORD_POOL_ENABLED"] = "false"
+    os.environ["TRACING_ENABLED"] = "false"
+
+    import main
+    return main
+
+
+async def run_strategy(main, strategy: str, keywords, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(keyword: str):
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            result = await main.generate_problem(keyword, strategy)
+            latencies.append(time.perf_counter() - start)
+            if not result or len(result.get("wrong_text", [])) != len(result.get("right_text", [])):
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(keyword) for keyword in keywords))
+    wall = time.perf_counter() - start
+
+    outcomes = main.problem_strategy_outcomes
+    report = {
+        "strategy": strategy,
+        "problems": len(keywords),
+        "failures": failures,
+        "failure_rate": round(failures / len(keywords), 4) if keywords else 0.0,
+        "wall_seconds": round(wall, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1) if latencies else 0.0,
+    }
+    if strategy == "combined":
+        for outcome in ("fallback_wrong_text", "fallback_split"):
+            report[outcome] = int(outcomes.value(strategy=strategy, outcome=outcome))
+    return report
+
+
+async def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_main(args, workdir)
+        base = args.keywords or DEFAULT_KEYWORDS
+        keywords = [f"{base[i % len(base)]}" for i in range(args.problems)]
+        reports = [await run_strategy(main, strategy, keywords, args.concurrency) for strategy in args.strategies]
+    return {
+        "revision": git_revision(),
+        "timestamp": time.time(),
+        "config": {
+            "provider": args.provider,
+            "problems": args.problems,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "tokens_per_sec": args.tokens_per_sec,
+            "malformed_rate": args.malformed_rate,
+        },
+        "strategies": reports,
+    }
+
+
+def print_table(result: dict):
+    print(f"revision {result['revision']}  provider {result['config']['provider']}")
+    print(f"{'strategy':<10}{'n':>5}{'fail%':>8}{'p50':>9}{'p95':>9}{'max':>9}{'fb_wrong':>10}{'fb_split':>10}")
+    for r in result["strategies"]:
+        print(f"{r['strategy']:<10}{r['problems']:>5}{r['failure_rate'] * 100:>8.1f}{r['p50_ms']:>9}"
+              f"{r['p95_ms']:>9}{r['max_ms']:>9}{r.get('fallback_wrong_text', '-'):>10}"
+              f"{r.get('fallback_split', '-'):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", default="local", choices=["local", "bedrock"])
+    parser.add_argument("--strategies", nargs="+", default=["split", "combined"], choices=["split", "combined"])
+    parser.add_argument("--problems", type=int, default=20, help="전략별 생성할 문제 수")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--keywords", nargs="*")
+    parser.add_argument("--latency", type=float, default=0.8, help="local LLM 첫 토큰 지연(초)")
+    parser.add_argument("--tokens-per-sec", type=float, default=80.0, help="local LLM 출력 속도")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="local LLM 출력 잘림 확률")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_table(result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
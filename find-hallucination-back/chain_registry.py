@@ -0,0 +1,101 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from langchain.prompts.chat import (
+    ChatPromptTemplate,
+    SystemMessagePromptTemplate,
+    HumanMessagePromptTemplate,
+)
+from langchain_core.messages import SystemMessage
+from langchain_core.output_parsers import JsonOutputParser
+from pydantic import BaseModel
+
+
+class ChainRegistry:
+    """
+    (프롬프트, 모델, temperature) 조합별로 prompt | llm | parser 체인을
+    프로세스 전체에서 한 번만 만들어 재사용한다.
+
+    - 프롬프트 템플릿과 format_instructions 렌더링은 체인 생성 시 한 번만 수행
+    - 채팅 모델은 (model, temperature) 단위로 캐시하여 같은 클라이언트/커넥션 풀을 공유
+    - cacheable이면 system 메시지를 미리 렌더링하고 뒤에 cache point를 붙여 공급자의 prompt cache 대상으로 표시
+    """
+
+    def __init__(self, model_factory: Callable[[str, float], Any]):
+        self._model_factory = model_factory
+        self._models: Dict[Tuple[str, float], Any] = {}
+        self._chains: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_model(self, model: str, temperature: float):
+        key = (model, temperature)
+        llm = self._models.get(key)
+        if llm is None:
+            with self._lock:
+                llm = self._models.get(key)
+                if llm is None:
+                    llm = self._model_factory(model, temperature)
+                    self._models[key] = llm
+        return llm
+
+    def get_chain(
+        self,
+        system_prompt: str,
+        human_prompt: str,
+        response_model: Type[BaseModel],
+        model: str,
+        temperature: float,
+        format_instructions: Optional[str] = None,
+        cacheable: bool = False,
+    ):
+        key = (system_prompt, human_prompt, response_model, model, temperature, format_instructions, cacheable)
+        chain = self._chains.get(key)
+        if chain is None:
+            llm = self.get_model(model, temperature)
+            with self._lock:
+                chain = self._chains.get(key)
+                if chain is None:
+                    parser = JsonOutputParser(pydantic_object=response_model)
+                    if format_instructions is None:
+                        format_instructions = parser.get_format_instructions()
+                    if cacheable:
+                        system_text = system_prompt.replace("{format_instructions}", format_instructions)
+                        system_message = SystemMessage(content=[
+                            {"type": "text", "text": system_text},
+                            {"cachePoint": {"type": "default"}},
+                        ])
+                    else:
+                        system_message = SystemMessagePromptTemplate.from_template(system_prompt)
+                    prompt = ChatPromptTemplate.from_messages([
+                        system_message,
+                        HumanMessagePromptTemplate.from_template(human_prompt),
+                    ])
+                    if "format_instructions" in prompt.input_variables:
+                        prompt = prompt.partial(format_instructions=format_instructions)
+                    chain = prompt | llm | parser
+                    self._chains[key] = chain
+                    logging.info(f"[ChainRegistry] built chain: {response_model.__name__} ({model}, {temperature})")
+        return chain
+
+    def get_prompt_chain(self, prompt, model: str, temperature: float):
+        """
+        prompt_registry.PromptVersion으로 체인을 만든다.
+        """
+        return self.get_chain(
+            prompt.system,
+            prompt.human,
+            prompt.response_model,
+            model=model,
+            temperature=temperature,
+            format_instructions=prompt.format_instructions,
+            cacheable=prompt.cacheable,
+        )
+
+    def stats(self) -> dict:
+        return {"models": len(self._models), "chains": len(self._chains)}
+
+    def clear(self):
+        with self._lock:
+            self._chains.clear()
+            self._models.clear()
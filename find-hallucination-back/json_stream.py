@@ -0,0 +1,54 @@
+import json
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class PartialJsonTracker:
+    """
+    JsonOutputParser가 스트리밍 중에 내보내는 부분 파싱 결과(dict)에서
+    '완성된' 값만 골라 한 번씩 이벤트로 돌려준다.
+
+    - 부분 파싱 결과는 JSON 출력 순서대로 key가 추가되므로,
+      어떤 key 뒤에 다른 key가 나타나면 그 key의 값은 완성된 것으로 본다.
+    - 리스트 필드는 다음 항목이 나타나거나 리스트 뒤에 다른 key가 나타나면
+      앞 항목이 완성된 것으로 본다.
+    - 스트림이 끝나면 finish()로 남은 값을 모두 내보낸다.
+    """
+
+    def __init__(self, fields: Iterable[str] = (), list_fields: Iterable[str] = ()):
+        self.fields = set(fields)
+        self.list_fields = set(list_fields)
+        self._emitted_fields = set()
+        self._emitted_items = {name: 0 for name in self.list_fields}
+
+    def feed(self, partial: Optional[dict]) -> List[Tuple[str, Any]]:
+        if not isinstance(partial, dict):
+            return []
+        return self._collect(partial, final=False)
+
+    def finish(self, final: Optional[dict]) -> List[Tuple[str, Any]]:
+        if not isinstance(final, dict):
+            return []
+        return self._collect(final, final=True)
+
+    def _collect(self, data: dict, final: bool) -> List[Tuple[str, Any]]:
+        events = []
+        keys = list(data.keys())
+        for pos, key in enumerate(keys):
+            closed = final or pos < len(keys) - 1
+            value = data[key]
+            if key in self.fields and key not in self._emitted_fields and closed:
+                self._emitted_fields.add(key)
+                events.append((key, value))
+            elif key in self.list_fields and isinstance(value, list):
+                done = len(value) if closed else len(value) - 1
+                for index in range(self._emitted_items[key], done):
+                    events.append((key, {"index": index, "text": value[index]}))
+                self._emitted_items[key] = max(self._emitted_items[key], done)
+        return events
+
+
+def sse_event(event: str, data: Any) -> str:
+    """
+    Server-Sent Events 포맷 문자열 생성
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
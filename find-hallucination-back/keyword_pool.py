@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Iterable, List, Optional
+
+from problem_pool import normalize_keyword
+
+
+class KeywordPool:
+    """
+    미리 생성해 둔 퀴즈 키워드 풀.
+
+    - 백그라운드 task가 generate(batch_size)로 키워드를 한 번에 여러 개 만들어 target_size까지 채운다.
+    - 다 채운 뒤에는 refresh_interval마다 한 batch를 새로 만들어 가장 오래된 키워드를 밀어낸다. (순환)
+    - draw(): 섞인 순서대로 돌아가며 꺼내므로, 한 바퀴를 다 돌기 전에는 같은 키워드가 다시 나오지 않는다.
+    - 중복 판정은 normalize_keyword 기준
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[int], Awaitable[List[str]]],
+        target_size: int = 300,
+        batch_size: int = 30,
+        refresh_interval: float = 300.0,
+        retry_interval: float = 5.0,
+        max_stale_batches: int = 3,
+    ):
+        self._generate = generate
+        self.target_size = target_size
+        self.batch_size = batch_size
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        # 새 키워드가 하나도 없는 batch가 이만큼 이어지면 target_size 전이라도 채우기를 멈추고 쉰다
+        self.max_stale_batches = max_stale_batches
+
+        self._keywords: "OrderedDict[str, str]" = OrderedDict()  # normalized -> keyword (오래된 순)
+        self._rotation: Deque[str] = deque()
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self._draws = 0
+        self._empty_draws = 0
+        self._batches = 0
+        self._batch_failures = 0
+        self._duplicates = 0
+        self._last_refresh: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def draw(self, count: int = 5) -> List[str]:
+        """
+        서로 다른 키워드 count개를 꺼낸다. 풀이 count개보다 작으면 있는 만큼, 비어 있으면 [].
+        """
+        self._draws += 1
+        count = min(count, len(self._keywords))
+        if count == 0:
+            self._empty_draws += 1
+            return []
+
+        keywords = []
+        while len(keywords) < count:
+            if not self._rotation:
+                self._reshuffle(exclude=keywords)
+            key = self._rotation.popleft()
+            keyword = self._keywords.get(key)
+            if keyword is not None and keyword not in keywords:
+                keywords.append(keyword)
+        return keywords
+
+    def add(self, keywords: Iterable[str]) -> int:
+        """
+        새 키워드를 추가하고(중복 제외) target_size를 넘으면 오래된 것부터 제거한다. 추가된 개수를 돌려준다.
+        """
+        new_keys = []
+        for keyword in keywords:
+            keyword = " ".join(str(keyword).split())
+            key = normalize_keyword(keyword)
+            if not key:
+                continue
+            if key in self._keywords:
+                self._duplicates += 1
+                continue
+            self._keywords[key] = keyword
+            new_keys.append(key)
+        while len(self._keywords) > self.target_size:
+            self._keywords.popitem(last=False)
+        if new_keys:
+            self._merge_rotation(new_keys)
+        return len(new_keys)
+
+    def __contains__(self, keyword: str) -> bool:
+        return normalize_keyword(keyword) in self._keywords
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._keywords),
+            "target_size": self.target_size,
+            "draws": self._draws,
+            "empty_draws": self._empty_draws,
+            "batches": self._batches,
+            "batch_failures": self._batch_failures,
+            "duplicates": self._duplicates,
+            "last_refresh_age": round(time.monotonic() - self._last_refresh, 1)
+            if self._last_refresh is not None else None,
+        }
+
+    # ------------------------------------------------------------------
+    # internal
+    # ------------------------------------------------------------------
+    def _reshuffle(self, exclude: List[str]):
+        keys = [key for key, keyword in self._keywords.items() if keyword not in exclude]
+        random.shuffle(keys)
+        self._rotation = deque(keys)
+
+    def _merge_rotation(self, new_keys: List[str]):
+        """
+        밀려난 key를 순환 목록에서 빼고, 새 key는 남은 순환 중간 아무 곳에 끼워 넣어 곧 노출되도록 한다.
+        (batch마다 순환 목록을 한 번만 다시 만든다)
+        """
+        rotation = [key for key in self._rotation if key in self._keywords]
+        inserts = sorted(
+            (random.randint(0, len(rotation)), key) for key in new_keys if key in self._keywords
+        )
+        merged = []
+        index = 0
+        for position, key in inserts:
+            merged.extend(rotation[index:position])
+            merged.append(key)
+            index = max(index, position)
+        merged.extend(rotation[index:])
+        self._rotation = deque(merged)
+
+    async def _refill_once(self) -> int:
+        self._batches += 1
+        try:
+            keywords = await self._generate(self.batch_size)
+        except Exception as e:
+            logging.error(f"[KeywordPool] batch error: {e}")
+            keywords = []
+        if not keywords:
+            self._batch_failures += 1
+            return 0
+        self._last_refresh = time.monotonic()
+        return self.add(keywords)
+
+    async def _run(self):
+        while True:
+            stale = 0
+            while len(self._keywords) < self.target_size and stale < self.max_stale_batches:
+                added = await self._refill_once()
+                stale = 0 if added else stale + 1
+                if not added:
+                    await asyncio.sleep(self.retry_interval)
+            logging.info(f"[KeywordPool] size: {len(self._keywords)}")
+
+            await asyncio.sleep(self.refresh_interval)
+            if len(self._keywords) >= self.target_size:
+                # 가득 찬 상태에서도 주기적으로 새 batch를 받아 오래된 키워드를 교체한다
+                await self._refill_once()
@@ -1,60 +1,43 @@
+import asyncio
 import logging
 import os
 import sqlite3
+import time
+from contextlib import asynccontextmanager
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from langchain.prompts.chat import (
-    ChatPromptTemplate,
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-)
-from langchain_aws import ChatBedrockConverse
-from langchain_core.output_parsers import JsonOutputParser
-from langfuse.callback import CallbackHandler
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+
+from chain_registry import ChainRegistry
+from json_stream import PartialJsonTracker, sse_event
+from keyword_pool import KeywordPool
+from llm_providers import get_provider
+from metrics import CONTENT_TYPE, MetricsRegistry
+from model_router import EscalationExhausted, ModelRouter
+from problem_cache import ProblemCache
+from problem_pool import ProblemPool, normalize_keyword
+from prompt_registry import PromptRegistry, PromptVersion
+from rankings_store import RankingsStore
+from single_flight import SingleFlight
+from tracing import TraceExporter, current_endpoint
+from warmup import WarmUp
 
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI()
-
-# CORS 설정 (모든 도메인 허용)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # ---------------------------
-# 순위 저장을 위한 데이터베이스 설정 (SQLite)
+# 순위 저장을 위한 데이터베이스 설정 (SQLite, lifespan에서 연다)
 # ---------------------------
-DATABASE = "rankings.db"
-
-
-def init_db():
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS rankings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nickname TEXT NOT NULL,
-            keyword TEXT NOT NULL,
-            elapsed_time REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
+DATABASE = os.getenv("RANKINGS_DB_PATH", "rankings.db")
 
-
-init_db()
+rankings_store = RankingsStore(DATABASE, limit=10,
+                              refresh_interval=float(os.getenv("RANKINGS_REFRESH_INTERVAL", "5")))
 
 
 # ----------------------------------------------------------------------
@@ -81,6 +64,13 @@ class GenerateWrongTextResponse(BaseModel):
     )
 
 
+class GenerateProblemResponse(GenerateRightTextResponse):
+    wrong_text: List[str] = Field(
+        ...,
+        description="right_text의 각 문장을 거짓된 내용으로 교체한 문장들 (개수와 순서는 right_text와 동일)"
+    )
+
+
 # 랭킹 저장 및 조회를 위한 모델
 class RankingRecord(BaseModel):
     nickname: str
@@ -99,6 +89,16 @@ class Prompts(Enum):
         
         출력 형식을 반드시 준수하여 JSON으로 출력해주세요.
         
+        # 출력 형식(JSON):
+        {format_instructions}
+        """
+    # 키워드 풀 채우기용 (한 번에 여러 개)
+    KEYWORDS_BULK_PROMPT_HUMAN = """
+        상식 퀴즈 생성을 위한 키워드를 무작위로 여러 분야에 걸쳐 최대한 다양하게 {count}개만 뽑아 주세요.
+        서로 겹치거나 비슷한 키워드는 피해 주세요.
+        
+        출력 형식을 반드시 준수하여 JSON으로 출력해주세요.
+        
         # 출력 형식(JSON):
         {format_instructions}
         """
@@ -170,6 +170,94 @@ class Prompts(Enum):
     ```
     """
 
+    # 한 번의 호출로 right_text와 wrong_text를 함께 생성 (PROBLEM_STRATEGY=combined)
+    COMBINED_PROBLEM_PROMPT_HUMAN = """
+        주어진 분야는 {keyword} 입니다. 해당 분야에 대한 심층적인 글을 작성하려고 합니다. 이를 위해 다음과 같은 단계로 진행해주세요.
+        
+        ## 1단계: 세부 주제와 글감 선정
+        - 흥미롭고 의미 있는 세부 주제를 하나 정하고, 핵심적인 내용을 다룰 글감을 선정하세요.
+        - 글감은 명확하고 구체적인 개념, 사건, 제품, 이론 등이 될 수 있습니다.
+        
+        ## 2단계: 글 작성
+        - 선정된 글감에 대해 **최소 500자, 최대 1000자, 최소 15문장, 최대 20문장** 사이의 글을 작성하세요.
+        - **사실 기반**으로 작성해야 하며, 논리적으로 문장이 연결되도록 한 문단으로 구성해야 합니다.
+        - 비전문가인 성인도 이해할 수 있는 수준으로 작성해주세요.
+        - `거의` 라는 단어를 남발하지 마세요.
+        
+        ## 3단계: 올바른 문장과 잘못된 문장 생성
+        - 작성한 문장을 문장 단위(마침표 기준)로 나누어 리스트(`right_text`)로 저장하세요.
+        - 같은 개수와 순서를 유지하면서 **모든 문장을 사실과 다르게 바꾼 리스트(`wrong_text`)**를 생성하세요.
+          - 날짜, 인물, 사건, 특징 등에 교묘한 거짓이나 논리적 모순을 섞되, 문장 구조는 원본과 유사해야 합니다.
+        
+        ## 4단계: JSON 출력
+        - 최종 결과만 반드시 JSON 형식으로 출력하세요:
+        {format_instructions}
+        """
+
+    # v2-compact: 예시와 JSON schema 전체 대신 짧은 규칙과 JSON 예시만 사용.
+    # system 메시지는 변수 없이 고정되어 공급자의 prompt cache 대상이 된다. (템플릿이 아니므로 중괄호 이스케이프 없음)
+    PROBLEM_COMPACT_SYSTEM = """당신은 창의적인 작가입니다.
+주어진 분야에서 흥미로운 세부 주제와 글감을 하나씩 정하고, 그 글감에 대한 사실 기반의 글을 작성합니다.
+
+## 규칙
+- 500~1000자, 15~20문장, 논리적으로 이어지는 한 문단
+- 비전문가인 성인도 이해할 수 있는 수준
+- `거의` 라는 단어를 남발하지 마세요.
+- 글을 문장 단위(마침표 기준)로 나눠 right_text 리스트에 담으세요.
+
+## 출력
+아래 형식의 JSON 하나만 출력하고, 다른 필드나 설명은 쓰지 마세요.
+{format_instructions}
+"""
+    PROBLEM_COMPACT_FORMAT = '{"category": "분야", "subject": "세부 주제", "story_idea": "글감", "right_text": ["문장", "..."]}'
+    PROBLEM_COMPACT_HUMAN = "주어진 분야는 {keyword} 입니다."
+
+    GENERATE_WRONG_TEXT_COMPACT_SYSTEM = """당신은 창의적인 작가입니다.
+주어진 문장 리스트의 각 문장에 날짜, 인물, 사건, 특징 등에 대한 교묘한 거짓이나 논리적 모순을 섞어 다시 씁니다.
+- 문장의 개수와 순서는 원본과 같아야 하고, 모든 문장이 원본과 달라야 합니다.
+- 아래 형식의 JSON 하나만 출력하세요.
+{format_instructions}
+"""
+    GENERATE_WRONG_TEXT_COMPACT_FORMAT = '{"wrong_text": ["거짓 문장", "..."]}'
+
+
+# 프롬프트 버전 (PROMPT_VERSIONS="right_text=v2-compact,wrong_text=v2-compact" 형식으로 선택, 기본값 v1)
+prompt_registry = PromptRegistry()
+prompt_registry.register(PromptVersion(
+    "keywords", "v1", Prompts.KEYWORDS_PROMPT_SYSTEM.value, Prompts.KEYWORDS_PROMPT_HUMAN.value,
+    GenerateKeywordsResponse,
+))
+prompt_registry.register(PromptVersion(
+    "keywords_bulk", "v1", Prompts.KEYWORDS_PROMPT_SYSTEM.value, Prompts.KEYWORDS_BULK_PROMPT_HUMAN.value,
+    GenerateKeywordsResponse,
+))
+prompt_registry.register(PromptVersion(
+    "right_text", "v1", Prompts.PROBLEM_PROMPT_SYSTEM.value, Prompts.PROBLEM_PROMPT_HUMAN.value,
+    GenerateRightTextResponse,
+))
+prompt_registry.register(PromptVersion(
+    "right_text", "v2-compact", Prompts.PROBLEM_COMPACT_SYSTEM.value, Prompts.PROBLEM_COMPACT_HUMAN.value,
+    GenerateRightTextResponse,
+    format_instructions=Prompts.PROBLEM_COMPACT_FORMAT.value,
+    cacheable=True,
+))
+prompt_registry.register(PromptVersion(
+    "wrong_text", "v1", Prompts.GENERATE_WRONG_TEXT_SYSTEM.value, Prompts.GENERATE_WRONG_TEXT_HUMAN.value,
+    GenerateWrongTextResponse,
+))
+prompt_registry.register(PromptVersion(
+    "wrong_text", "v2-compact", Prompts.GENERATE_WRONG_TEXT_COMPACT_SYSTEM.value,
+    Prompts.GENERATE_WRONG_TEXT_HUMAN.value,
+    GenerateWrongTextResponse,
+    format_instructions=Prompts.GENERATE_WRONG_TEXT_COMPACT_FORMAT.value,
+    cacheable=True,
+))
+prompt_registry.register(PromptVersion(
+    "combined", "v1", Prompts.PROBLEM_PROMPT_SYSTEM.value, Prompts.COMBINED_PROBLEM_PROMPT_HUMAN.value,
+    GenerateProblemResponse,
+))
+prompt_registry.activate_all(os.getenv("PROMPT_VERSIONS", ""))
+
 
 # ----------------------------------------------------------------------
 # 3) BedrockChatModel Enum (예시)
@@ -180,69 +268,369 @@ class BedrockChatModel(Enum):
 
 
 # ----------------------------------------------------------------------
-# 4) get_chat_model (Stub)
+# 4) get_chat_model (LLM_PROVIDER: bedrock | local)
 # ----------------------------------------------------------------------
+llm_provider = get_provider()
+
+
 def get_chat_model(model: str, temperature: float):
-    if os.getenv("PHASE") == "LOCAL":
-        return ChatBedrockConverse(
-            model=model,
-            temperature=temperature,
-            region_name="us-west-2",
-            credentials_profile_name="saml",
-        )
+    return llm_provider.create_chat_model(model=model, temperature=temperature)
+
+
+chain_registry = ChainRegistry(get_chat_model)
+
+
+# ----------------------------------------------------------------------
+# Langfuse trace (샘플링 + 백그라운드 배치 전송, 요청 경로에서는 큐에 넣기만 함)
+# ----------------------------------------------------------------------
+def create_langfuse_client():
+    from langfuse import Langfuse
+
+    return Langfuse(
+        public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
+        secret_key=os.getenv("LANGFUSE_SECRET_KEY"),
+        host=os.getenv("LANGFUSE_HOST"),
+    )
+
+
+tracer = TraceExporter(
+    client_factory=create_langfuse_client,
+    enabled=os.getenv("TRACING_ENABLED", "true").lower() == "true" and bool(os.getenv("LANGFUSE_PUBLIC_KEY")),
+    sample_rate=float(os.getenv("TRACING_SAMPLE_RATE", "1.0")),
+    max_queue=int(os.getenv("TRACING_MAX_QUEUE", "1000")),
+    batch_size=int(os.getenv("TRACING_BATCH_SIZE", "50")),
+    flush_interval=float(os.getenv("TRACING_FLUSH_INTERVAL", "2.0")),
+    disabled_endpoints=os.getenv("TRACING_DISABLED_ENDPOINTS", "").split(","),
+    tags=["find-hallucination"],
+)
+
+
+# ----------------------------------------------------------------------
+# 메트릭 (GET /metrics, Prometheus 텍스트 형식)
+# ----------------------------------------------------------------------
+metrics = MetricsRegistry()
+stage_seconds = metrics.histogram(
+    "find_hallucination_stage_seconds",
+    "Latency of each stage (queue_wait, prompt_build, time_to_first_token, generation, parse, sqlite_write, ...)",
+    ["operation", "stage"],
+)
+llm_in_flight = metrics.gauge("find_hallucination_llm_in_flight", "LLM calls currently running", ["operation"])
+llm_waiting = metrics.gauge("find_hallucination_llm_waiting", "LLM calls waiting for a concurrency slot", ["operation"])
+llm_errors = metrics.counter("find_hallucination_llm_errors_total", "Failed LLM calls", ["operation"])
+llm_tokens = metrics.counter("find_hallucination_llm_tokens_total", "LLM tokens", ["operation", "model", "type"])
+sqlite_lock_errors = metrics.counter(
+    "find_hallucination_sqlite_lock_errors_total", "SQLite 'database is locked' errors", ["operation"],
+)
+http_in_flight = metrics.gauge("find_hallucination_http_in_flight", "HTTP requests currently being handled", ["path"])
+http_requests = metrics.counter("find_hallucination_http_requests_total", "HTTP requests", ["method", "path", "status"])
+http_seconds = metrics.histogram(
+    "find_hallucination_http_request_seconds",
+    "Time until the response starts (streaming bodies are not included)",
+    ["method", "path"],
+)
+
+
+llm_call_tokens = metrics.histogram(
+    "find_hallucination_llm_call_tokens",
+    "Tokens per LLM call (input, output, cache_read, cache_write)",
+    ["operation", "prompt_version", "type"],
+    buckets=(50, 100, 200, 400, 800, 1600, 3200, 6400, 12800),
+)
+
+
+def record_token_usage(operation: str, model: str, prompt_version: str, usage: dict):
+    """
+    호출 한 번의 토큰 사용량 기록 (공급자가 prompt cache 사용량을 주면 함께 기록)
+    """
+    details = usage.get("input_token_details") or {}
+    counts = {
+        "input": usage.get("input_tokens", 0),
+        "output": usage.get("output_tokens", 0),
+        "cache_read": details.get("cache_read", 0),
+        "cache_write": details.get("cache_creation", 0),
+    }
+    for token_type, count in counts.items():
+        if count or token_type in ("input", "output"):
+            llm_tokens.inc(count, operation=operation, model=model, type=token_type)
+            llm_call_tokens.observe(count, operation=operation, prompt_version=prompt_version, type=token_type)
+
+
+def model_label(llm) -> str:
+    return getattr(llm, "model_id", None) or getattr(llm, "model_name", None) or type(llm).__name__
+
+
+def timed_call(operation: str, stage: str, func, *args):
+    """
+    asyncio.to_thread 안에서 실제 작업 시간만 따로 기록할 때 사용
+    """
+    with stage_seconds.time(operation=operation, stage=stage):
+        return func(*args)
+
+
+# ----------------------------------------------------------------------
+# LLM 호출 동시성 제한 (이벤트 루프를 막지 않도록 비동기 호출 사용)
+# ----------------------------------------------------------------------
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+
+@asynccontextmanager
+async def llm_slot(operation: str, inputs: dict, prompt_version: str = ""):
+    """
+    동시성 슬롯을 잡고(queue_wait) 호출 전체(total)를 기록한다.
+    샘플링된 호출이면 trace 기록용 dict를, 아니면 None을 넘긴다. (전송은 tracer 스레드에서)
+    """
+    trace = tracer.start_trace(operation, inputs)
+    if trace is not None:
+        trace["prompt_version"] = prompt_version
+    with llm_waiting.track(operation=operation), stage_seconds.time(operation=operation, stage="queue_wait"):
+        await llm_semaphore.acquire()
+    try:
+        with llm_in_flight.track(operation=operation), stage_seconds.time(operation=operation, stage="total"):
+            yield trace
+    except Exception as e:
+        llm_errors.inc(operation=operation)
+        tracer.finish_trace(trace, error=e)
+        raise
     else:
-        return ChatBedrockConverse(
-            model=model,
-            temperature=temperature,
-            region_name="us-west-2",
-        )
+        tracer.finish_trace(trace)
+    finally:
+        llm_semaphore.release()
+
+
+def observe_stage(trace, operation: str, stage: str, seconds: float):
+    stage_seconds.observe(seconds, operation=operation, stage=stage)
+    if trace is not None:
+        trace["stages"][stage] = round(seconds, 4)
+
+
+async def generation_stream(llm, prompt_value, operation: str, trace=None, prompt_version: str = ""):
+    """
+    모델 출력 chunk를 그대로 넘기면서 첫 토큰까지의 시간, 생성 시간, 토큰 수를 기록한다.
+    """
+    start = time.perf_counter()
+    first_token = None
+    usage = {}
+    if trace is not None:
+        trace.update(generation_start=time.time(), prompt=prompt_value, model=model_label(llm))
+    async for chunk in llm.astream(prompt_value):
+        if first_token is None:
+            first_token = time.perf_counter()
+            observe_stage(trace, operation, "time_to_first_token", first_token - start)
+            if trace is not None:
+                trace["first_token"] = time.time()
+        usage = getattr(chunk, "usage_metadata", None) or usage
+        yield chunk
+    observe_stage(trace, operation, "generation", time.perf_counter() - start)
+
+    record_token_usage(operation, model_label(llm), prompt_version, usage)
+    if trace is not None:
+        trace["usage"] = usage
 
 
-langfuse_handler = CallbackHandler(
-    public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
-    secret_key=os.getenv("LANGFUSE_SECRET_KEY"),
-    host=os.getenv("LANGFUSE_HOST"),
-    tags=["find-hallucination"]
+async def build_prompt(prompt, inputs: dict, operation: str, trace=None):
+    start = time.perf_counter()
+    prompt_value = await prompt.ainvoke(inputs)
+    observe_stage(trace, operation, "prompt_build", time.perf_counter() - start)
+    return prompt_value
+
+
+async def invoke_chain(chain, inputs: dict, operation: str = "llm", prompt_version: str = ""):
+    """
+    prompt | llm | parser 체인을 단계별로 실행하며 단계별 시간을 기록한다.
+    (첫 토큰까지의 시간을 재기 위해 모델은 스트리밍으로 호출하고, 파싱은 완성된 응답으로 한 번만 수행)
+    """
+    prompt, llm, parser = chain.first, chain.middle[0], chain.last
+    async with llm_slot(operation, inputs, prompt_version) as trace:
+        prompt_value = await build_prompt(prompt, inputs, operation, trace)
+        message = None
+        async for chunk in generation_stream(llm, prompt_value, operation, trace, prompt_version):
+            message = chunk if message is None else message + chunk
+        start = time.perf_counter()
+        result = parser.invoke(message)
+        observe_stage(trace, operation, "parse", time.perf_counter() - start)
+        if trace is not None:
+            trace["output"] = result
+        return result
+
+
+async def stream_chain(chain, inputs: dict, operation: str = "llm", prompt_version: str = ""):
+    """
+    JsonOutputParser의 부분 파싱 결과를 토큰 스트림에 맞춰 순서대로 내보낸다.
+    """
+    prompt, llm, parser = chain.first, chain.middle[0], chain.last
+    async with llm_slot(operation, inputs, prompt_version) as trace:
+        prompt_value = await build_prompt(prompt, inputs, operation, trace)
+        chunks = generation_stream(llm, prompt_value, operation, trace, prompt_version)
+        async for partial in parser.atransform(chunks):
+            if trace is not None:
+                trace["output"] = partial
+            yield partial
+
+
+# ----------------------------------------------------------------------
+# 모델 라우팅 (단순한 작업은 NOVA_MICRO 먼저, 검증 실패 시 NOVA_PRO로 escalation)
+# ----------------------------------------------------------------------
+MODEL_ROUTING_ENABLED = os.getenv("MODEL_ROUTING_ENABLED", "true").lower() == "true"
+MODEL_ROUTING_FAST_OPERATIONS = os.getenv(
+    "MODEL_ROUTING_FAST_OPERATIONS", "generate_keywords,generate_keyword_batch,generate_wrong_text"
+).split(",")
+
+# 문제 화면에서 5개 문장을 거짓 문장으로 바꾸므로 최소 5문장이 필요
+MIN_RIGHT_TEXT_SENTENCES = 5
+
+llm_model_seconds = metrics.histogram(
+    "find_hallucination_llm_model_seconds", "LLM attempt latency per routed model", ["operation", "model"]
+)
+llm_route_attempts = metrics.counter(
+    "find_hallucination_llm_route_attempts_total", "Routed LLM attempts by outcome", ["operation", "model", "outcome"]
 )
 
 
+def record_route_attempt(operation: str, model: str, seconds: float, outcome: str):
+    llm_model_seconds.observe(seconds, operation=operation, model=model)
+    llm_route_attempts.inc(operation=operation, model=model, outcome=outcome)
+
+
+model_router = ModelRouter(
+    routes={
+        operation.strip(): [BedrockChatModel.NOVA_MICRO.value, BedrockChatModel.NOVA_PRO.value]
+        for operation in MODEL_ROUTING_FAST_OPERATIONS if operation.strip()
+    } if MODEL_ROUTING_ENABLED else {},
+    default=BedrockChatModel.NOVA_PRO.value,
+    on_attempt=record_route_attempt,
+)
+
+
+def validate_keywords(min_count: int):
+    def validate(result) -> Optional[str]:
+        try:
+            response = GenerateKeywordsResponse.model_validate(result)
+        except ValidationError:
+            return "schema"
+        if len([keyword for keyword in response.keywords if keyword.strip()]) < min_count:
+            return "count"
+        return None
+    return validate
+
+
+def validate_right_text(result) -> Optional[str]:
+    try:
+        response = GenerateRightTextResponse.model_validate(result)
+    except ValidationError:
+        return "schema"
+    if len([text for text in response.right_text if text.strip()]) < MIN_RIGHT_TEXT_SENTENCES:
+        return "count"
+    return None
+
+
+def validate_wrong_text(right_text: List[str]):
+    def validate(result) -> Optional[str]:
+        try:
+            response = GenerateWrongTextResponse.model_validate(result)
+        except ValidationError:
+            return "schema"
+        if len(response.wrong_text) != len(right_text):
+            return "count"
+        for right, wrong in zip(right_text, response.wrong_text):
+            # 바뀌지 않은 문장이 오류 문장으로 뽑히면 찾을 수 없는 문제가 된다
+            if not wrong.strip() or " ".join(wrong.split()) == " ".join(right.split()):
+                return "unchanged"
+        return None
+    return validate
+
+
 # ----------------------------------------------------------------------
 # 5) 키워드 생성 함수
 # ----------------------------------------------------------------------
-def generate_keywords() -> dict:
+def get_keywords_chain(model: str = BedrockChatModel.NOVA_PRO.value, prompt: Optional[PromptVersion] = None):
+    return chain_registry.get_prompt_chain(prompt or prompt_registry.get("keywords"), model=model, temperature=1)
+
+
+KEYWORDS_FALLBACK = ["ChatGPT", "AI 규제", "우주 탐사"]
+
+# 동시에 들어온 키워드 요청은 LLM 호출 하나를 공유하고, 끝난 결과도 잠시 재사용한다
+keywords_flight = SingleFlight(reuse_window=float(os.getenv("KEYWORDS_REUSE_WINDOW", "3")))
+
+
+async def generate_keywords() -> dict:
     state = {}
-    parser = JsonOutputParser(pydantic_object=GenerateKeywordsResponse)
-    keywords_prompt = ChatPromptTemplate.from_messages([
-        SystemMessagePromptTemplate.from_template(Prompts.KEYWORDS_PROMPT_SYSTEM.value),
-        HumanMessagePromptTemplate.from_template(Prompts.KEYWORDS_PROMPT_HUMAN.value),
-    ]).partial(format_instructions=parser.get_format_instructions())
-    llm = get_chat_model(model=BedrockChatModel.NOVA_PRO.value, temperature=1)
-    chain = keywords_prompt | llm | parser
     try:
-        llm_response = chain.invoke({}, config={"callbacks": [langfuse_handler]})
+        llm_response = await keywords_flight.do("keywords", lambda: model_router.run(
+            "generate_keywords",
+            lambda model: invoke_chain(get_keywords_chain(model), {}, operation="generate_keywords",
+                                       prompt_version=prompt_registry.get("keywords").label),
+            validate_keywords(KEYWORDS_PER_REQUEST),
+        ))
         state = llm_response
         logging.info(f"[generate_keywords]: {state}")
     except Exception as e:
         logging.error(f"[generate_keywords] error: {e}")
-        state["keywords"] = ["ChatGPT", "AI 규제", "우주 탐사"]
+        state["keywords"] = list(KEYWORDS_FALLBACK)
     return state
 
 
+def get_keywords_bulk_chain(model: str = BedrockChatModel.NOVA_PRO.value, prompt: Optional[PromptVersion] = None):
+    return chain_registry.get_prompt_chain(prompt or prompt_registry.get("keywords_bulk"), model=model, temperature=1)
+
+
+async def generate_keyword_batch(count: int) -> List[str]:
+    llm_response = await model_router.run(
+        "generate_keyword_batch",
+        lambda model: invoke_chain(get_keywords_bulk_chain(model), {"count": count}, operation="generate_keyword_batch",
+                                   prompt_version=prompt_registry.get("keywords_bulk").label),
+        validate_keywords(max(1, count // 2)),
+    )
+    keywords = llm_response.get("keywords") if isinstance(llm_response, dict) else None
+    return [keyword for keyword in keywords or [] if isinstance(keyword, str)]
+
+
+KEYWORD_POOL_ENABLED = os.getenv("KEYWORD_POOL_ENABLED", "true").lower() == "true"
+KEYWORDS_PER_REQUEST = int(os.getenv("KEYWORDS_PER_REQUEST", "5"))
+
+keyword_pool = KeywordPool(
+    generate=generate_keyword_batch,
+    target_size=int(os.getenv("KEYWORD_POOL_SIZE", "300")),
+    batch_size=int(os.getenv("KEYWORD_POOL_BATCH_SIZE", "30")),
+    refresh_interval=float(os.getenv("KEYWORD_POOL_REFRESH_INTERVAL", "300")),
+)
+
+
+async def draw_keywords() -> dict:
+    """
+    키워드 풀에서 꺼내고, 풀이 비어 있을 때만 실시간 생성(실패 시 고정 목록)으로 넘어간다.
+    """
+    keywords = keyword_pool.draw(KEYWORDS_PER_REQUEST)
+    if keywords:
+        return {"keywords": keywords}
+    result = await generate_keywords()
+    # 실시간으로 받은 키워드도 풀에 넣어 둔다
+    if result.get("keywords") != KEYWORDS_FALLBACK:
+        keyword_pool.add(result.get("keywords", []))
+    return result
+
+
 # ----------------------------------------------------------------------
 # 6) 문제 생성 함수
 # ----------------------------------------------------------------------
-def generate_right_text(keyword: str) -> dict:
-    state = {}
+def get_right_text_chain(model: str = BedrockChatModel.NOVA_PRO.value, prompt: Optional[PromptVersion] = None):
+    return chain_registry.get_prompt_chain(prompt or prompt_registry.get("right_text"), model=model, temperature=0.7)
+
 
-    parser = JsonOutputParser(pydantic_object=GenerateRightTextResponse)
-    problem_prompt = ChatPromptTemplate.from_messages([
-        SystemMessagePromptTemplate.from_template(Prompts.PROBLEM_PROMPT_SYSTEM.value),
-        HumanMessagePromptTemplate.from_template(Prompts.PROBLEM_PROMPT_HUMAN.value),
-    ]).partial(format_instructions=parser.get_format_instructions())
-    llm = get_chat_model(model=BedrockChatModel.NOVA_PRO.value, temperature=0.7)
-    chain = problem_prompt | llm | parser
+def get_wrong_text_chain(model: str = BedrockChatModel.NOVA_PRO.value, prompt: Optional[PromptVersion] = None):
+    return chain_registry.get_prompt_chain(prompt or prompt_registry.get("wrong_text"), model=model, temperature=0.7)
+
+
+async def generate_right_text(keyword: str, prompt: Optional[PromptVersion] = None) -> dict:
+    state = {}
+    prompt = prompt or prompt_registry.get("right_text")
     try:
-        llm_response = chain.invoke({"keyword": keyword}, config={"callbacks": [langfuse_handler]})
+        llm_response = await model_router.run(
+            "generate_right_text",
+            lambda model: invoke_chain(get_right_text_chain(model, prompt), {"keyword": keyword},
+                                       operation="generate_right_text", prompt_version=prompt.label),
+            validate_right_text,
+        )
         state = llm_response
         logging.info(f"[generate_problem]: {state}")
     except Exception as e:
@@ -250,18 +638,28 @@ def generate_right_text(keyword: str) -> dict:
     return state
 
 
-def generate_wrong_text(right_text: List[str]) -> dict:
-    state = {}
+# 0이면 한 번에 생성, 양수이면 right_text를 해당 문장 수 단위로 나눠 병렬 생성
+WRONG_TEXT_CHUNK_SIZE = int(os.getenv("WRONG_TEXT_CHUNK_SIZE", "0"))
+
+
+def chunk_sentences(sentences: List[str], chunk_size: int) -> List[List[str]]:
+    return [sentences[i:i + chunk_size] for i in range(0, len(sentences), chunk_size)]
+
+
+async def generate_wrong_text(right_text: List[str], chunk_size: int = WRONG_TEXT_CHUNK_SIZE,
+                              prompt: Optional[PromptVersion] = None) -> dict:
+    if chunk_size > 0 and len(right_text) > chunk_size:
+        return await generate_wrong_text_chunked(right_text, chunk_size)
 
-    parser = JsonOutputParser(pydantic_object=GenerateWrongTextResponse)
-    problem_prompt = ChatPromptTemplate.from_messages([
-        SystemMessagePromptTemplate.from_template(Prompts.GENERATE_WRONG_TEXT_SYSTEM.value),
-        HumanMessagePromptTemplate.from_template(Prompts.GENERATE_WRONG_TEXT_HUMAN.value),
-    ]).partial(format_instructions=parser.get_format_instructions())
-    llm = get_chat_model(model=BedrockChatModel.NOVA_PRO.value, temperature=0.7)
-    chain = problem_prompt | llm | parser
+    state = {}
+    prompt = prompt or prompt_registry.get("wrong_text")
     try:
-        llm_response = chain.invoke({"right_text": right_text}, config={"callbacks": [langfuse_handler]})
+        llm_response = await model_router.run(
+            "generate_wrong_text",
+            lambda model: invoke_chain(get_wrong_text_chain(model, prompt), {"right_text": right_text},
+                                       operation="generate_wrong_text", prompt_version=prompt.label),
+            validate_wrong_text(right_text),
+        )
         state = llm_response
         logging.info(f"[generate_wrong_text]: {state}")
     except Exception as e:
@@ -269,12 +667,462 @@ def generate_wrong_text(right_text: List[str]) -> dict:
     return state
 
 
+async def generate_wrong_text_chunked(right_text: List[str], chunk_size: int) -> dict:
+    """
+    right_text를 chunk_size 문장씩 나눠 동시에 거짓 문장을 생성하고 원래 순서대로 합친다.
+    chunk 하나라도 문장 수가 맞지 않으면 실패({})로 처리한다.
+    """
+    chunks = chunk_sentences(right_text, chunk_size)
+    responses = await asyncio.gather(*(generate_wrong_text(chunk, chunk_size=0) for chunk in chunks))
+
+    wrong_text = []
+    for index, (chunk, response) in enumerate(zip(chunks, responses)):
+        chunk_wrong = response.get("wrong_text") or []
+        if len(chunk_wrong) != len(chunk):
+            logging.error(f"[generate_wrong_text_chunked] chunk {index} length mismatch: "
+                          f"{len(chunk_wrong)} != {len(chunk)}")
+            return {}
+        wrong_text.extend(chunk_wrong)
+
+    if len(wrong_text) != len(right_text):
+        logging.error(f"[generate_wrong_text_chunked] length mismatch: {len(wrong_text)} != {len(right_text)}")
+        return {}
+    return {"wrong_text": wrong_text}
+
+
+async def generate_problem_split(keyword: str) -> dict:
+    result = await generate_right_text(keyword)
+    right_text = result.get("right_text")
+    if not right_text:
+        return {}
+
+    # 토큰 수 제약으로 인해 wrong 텍스트 생성 분리
+    wrong_text_response = await generate_wrong_text(right_text)
+    wrong_text = wrong_text_response.get("wrong_text")
+    if not wrong_text:
+        return {}
+
+    result["wrong_text"] = wrong_text
+    return result
+
+
+def get_combined_chain(model: str = BedrockChatModel.NOVA_PRO.value, prompt: Optional[PromptVersion] = None):
+    return chain_registry.get_prompt_chain(prompt or prompt_registry.get("combined"), model=model, temperature=0.7)
+
+
+def validate_problem(result) -> Optional[str]:
+    reason = validate_right_text(result)
+    if reason is None:
+        reason = validate_wrong_text(result["right_text"])(result)
+    return reason
+
+
+async def generate_problem_combined(keyword: str) -> dict:
+    """
+    한 번의 호출로 right_text와 wrong_text를 함께 생성한다.
+    출력이 잘려 wrong_text가 맞지 않으면 right_text는 살리고 wrong_text만 따로 생성하고,
+    right_text부터 맞지 않으면 분리 생성(split)으로 처음부터 다시 만든다.
+    """
+    prompt = prompt_registry.get("combined")
+    try:
+        result = await model_router.run(
+            "generate_combined",
+            lambda model: invoke_chain(get_combined_chain(model, prompt), {"keyword": keyword},
+                                       operation="generate_combined", prompt_version=prompt.label),
+            validate_problem,
+        )
+    except EscalationExhausted as e:
+        # 검증에는 실패했지만 right_text는 살릴 수 있을 수 있으므로 마지막 결과로 아래 fallback을 판단한다
+        logging.warning(f"[generate_problem_combined] {e}")
+        result = e.result
+    except Exception as e:
+        logging.error(f"[generate_problem_combined] error: {e}")
+        result = None
+
+    if validate_right_text(result) is not None:
+        problem_strategy_outcomes.inc(strategy="combined", outcome="fallback_split")
+        return await generate_problem_split(keyword)
+
+    problem = {field: result[field] for field in ("category", "subject", "story_idea", "right_text")}
+    if validate_wrong_text(problem["right_text"])(result) is None:
+        problem_strategy_outcomes.inc(strategy="combined", outcome="ok")
+        problem["wrong_text"] = result["wrong_text"]
+        return problem
+
+    problem_strategy_outcomes.inc(strategy="combined", outcome="fallback_wrong_text")
+    wrong_text = (await generate_wrong_text(problem["right_text"])).get("wrong_text")
+    if not wrong_text:
+        return {}
+    problem["wrong_text"] = wrong_text
+    return problem
+
+
+# split: right_text / wrong_text를 두 번에 나눠 생성, combined: 한 번에 생성 (잘리면 split으로 대체)
+PROBLEM_STRATEGIES = ("split", "combined")
+PROBLEM_STRATEGY = os.getenv("PROBLEM_STRATEGY", "split")
+if PROBLEM_STRATEGY not in PROBLEM_STRATEGIES:
+    raise ValueError(f"unknown PROBLEM_STRATEGY: {PROBLEM_STRATEGY}")
+
+problem_strategy_outcomes = metrics.counter(
+    "find_hallucination_problem_strategy_total", "Problem generations by strategy and outcome", ["strategy", "outcome"]
+)
+
+
+async def generate_problem(keyword: str, strategy: Optional[str] = None) -> dict:
+    strategy = strategy or PROBLEM_STRATEGY
+    with stage_seconds.time(operation="generate_problem", stage=strategy):
+        if strategy == "combined":
+            result = await generate_problem_combined(keyword)
+        else:
+            result = await generate_problem_split(keyword)
+    # 검증을 통과한 문제만 돌려준다 (캐시/풀에 들어가거나 클라이언트로 나가기 전 마지막 검사)
+    reason = validate_problem(result) if result else "empty"
+    if reason is not None:
+        if result:
+            logging.error(f"[generate_problem] invalid problem ({reason}): {keyword}")
+        problem_strategy_outcomes.inc(strategy=strategy, outcome="failed")
+        return {}
+    if strategy == "split":
+        problem_strategy_outcomes.inc(strategy=strategy, outcome="ok")
+    return result
+
+
+async def stream_problem(keyword: str):
+    """
+    문제를 SSE 이벤트로 스트리밍한다.
+    category/subject와 right_text 문장은 파싱되는 즉시, 이어서 wrong_text 문장을 보낸다.
+    마지막에 전체 문제를 담은 done 이벤트(실패 시 error 이벤트)를 보낸다.
+    스트리밍은 항상 split 방식으로 생성하므로 풀/캐시도 split으로 만든 문제만 사용한다.
+    """
+    # 풀/캐시에 준비된 문제가 있으면 바로 전송
+    pooled = await take_pooled_problem(keyword, "split") or await get_cached_problem(keyword, "split")
+    track_requested_keyword(keyword, "split")
+    if pooled:
+        for field in ("category", "subject"):
+            yield sse_event(field, pooled.get(field))
+        for field in ("right_text", "wrong_text"):
+            for index, text in enumerate(pooled[field]):
+                yield sse_event(field, {"index": index, "text": text})
+        yield sse_event("done", pooled)
+        return
+
+    try:
+        result = {}
+        tracker = PartialJsonTracker(fields=("category", "subject"), list_fields=("right_text",))
+        async for partial in stream_chain(get_right_text_chain(), {"keyword": keyword},
+                                        operation="generate_right_text",
+                                        prompt_version=prompt_registry.get("right_text").label):
+            result = partial
+            for event, data in tracker.feed(partial):
+                yield sse_event(event, data)
+        for event, data in tracker.finish(result):
+            yield sse_event(event, data)
+        logging.info(f"[stream_problem] right_text: {result}")
+
+        # /api/problem과 같은 검증 (문장 수가 부족하면 wrong_text를 만들기 전에 실패 처리)
+        reason = validate_right_text(result)
+        if reason is not None:
+            logging.error(f"[stream_problem] invalid right_text ({reason}): {keyword}")
+            yield sse_event("error", {"detail": "problem generation failed"})
+            return
+        right_text = result["right_text"]
+
+        wrong_result = {}
+        if 0 < WRONG_TEXT_CHUNK_SIZE < len(right_text):
+            # chunk들을 동시에 생성하고, 앞 chunk부터 완료되는 대로 순서대로 전송
+            chunks = chunk_sentences(right_text, WRONG_TEXT_CHUNK_SIZE)
+            tasks = [asyncio.create_task(generate_wrong_text(chunk, chunk_size=0)) for chunk in chunks]
+            wrong_text = []
+            try:
+                for chunk, task in zip(chunks, tasks):
+                    chunk_wrong = (await task).get("wrong_text") or []
+                    if len(chunk_wrong) != len(chunk):
+                        logging.error(f"[stream_problem] chunk length mismatch: {len(chunk_wrong)} != {len(chunk)}")
+                        wrong_text = []
+                        break
+                    for text in chunk_wrong:
+                        yield sse_event("wrong_text", {"index": len(wrong_text), "text": text})
+                        wrong_text.append(text)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            wrong_result = {"wrong_text": wrong_text}
+        else:
+            tracker = PartialJsonTracker(list_fields=("wrong_text",))
+            async for partial in stream_chain(get_wrong_text_chain(), {"right_text": right_text},
+                                            operation="generate_wrong_text",
+                                            prompt_version=prompt_registry.get("wrong_text").label):
+                wrong_result = partial
+                for event, data in tracker.feed(partial):
+                    yield sse_event(event, data)
+            for event, data in tracker.finish(wrong_result):
+                yield sse_event(event, data)
+        logging.info(f"[stream_problem] wrong_text: {wrong_result}")
+
+        wrong_text = wrong_result.get("wrong_text") if isinstance(wrong_result, dict) else None
+        result["wrong_text"] = wrong_text
+        # 검증을 통과한 문제만 done으로 보내고 캐시에 넣는다 (잘못된 문제가 /api/problem 캐시를 오염시키지 않도록)
+        reason = validate_problem(result)
+        if reason is not None:
+            logging.error(f"[stream_problem] invalid problem ({reason}): {keyword}")
+            yield sse_event("error", {"detail": "problem generation failed"})
+            return
+
+        yield sse_event("done", result)
+        await put_cached_problem(keyword, result, "split")
+    except Exception as e:
+        logging.error(f"[stream_problem] error: {e}")
+        yield sse_event("error", {"detail": "problem generation failed"})
+
+
 # ----------------------------------------------------------------------
-# 7) API 엔드포인트
+# 7) 문제 풀 (미리 생성한 문제 보관) / 디스크 캐시
 # ----------------------------------------------------------------------
+PROBLEM_CACHE_ENABLED = os.getenv("PROBLEM_CACHE_ENABLED", "true").lower() == "true"
+
+problem_cache = ProblemCache(
+    path=os.getenv("PROBLEM_CACHE_PATH", "problem_cache.db"),
+    ttl=float(os.getenv("PROBLEM_CACHE_TTL", "86400")),
+    max_bytes=int(os.getenv("PROBLEM_CACHE_MAX_BYTES", str(50 * 1024 * 1024))),
+    variety=int(os.getenv("PROBLEM_CACHE_VARIETY", "3")),
+)
+
+
+def problem_cache_spec(strategy: Optional[str] = None) -> dict:
+    """
+    캐시 키에 들어가는 프롬프트/모델/temperature (프롬프트나 모델, 생성 방식이 바뀌면 자동으로 다른 키가 된다)
+    """
+    strategy = strategy or PROBLEM_STRATEGY
+    return {
+        "prompt_text": "\n".join(
+            f"{prompt.label}\n{prompt.system}\n{prompt.human}"
+            for prompt in (prompt_registry.get("right_text"), prompt_registry.get("wrong_text"))
+            + ((prompt_registry.get("combined"),) if strategy == "combined" else ())
+        ),
+        "model": "|".join([
+            ",".join(model_router.route("generate_right_text")),
+            ",".join(model_router.route("generate_wrong_text")),
+        ]),
+        "temperature": 0.7,
+    }
+
+
+async def get_cached_problem(keyword: str, strategy: Optional[str] = None):
+    if not PROBLEM_CACHE_ENABLED:
+        return None
+    return await asyncio.to_thread(problem_cache.get, keyword, **problem_cache_spec(strategy))
+
+
+async def put_cached_problem(keyword: str, problem: dict, strategy: Optional[str] = None):
+    if PROBLEM_CACHE_ENABLED and problem:
+        await asyncio.to_thread(problem_cache.put, keyword, problem=problem, **problem_cache_spec(strategy))
+
+
+async def generate_problem_cached(keyword: str, strategy: Optional[str] = None) -> dict:
+    result = await get_cached_problem(keyword, strategy)
+    if result is None:
+        result = await generate_problem(keyword, strategy)
+        await put_cached_problem(keyword, result, strategy)
+    return result
+
+
+# 같은 키워드의 동시 요청은 문제 생성 하나를 공유한다 (실패/빈 결과는 재사용하지 않음)
+problem_flight = SingleFlight(reuse_window=float(os.getenv("PROBLEM_REUSE_WINDOW", "2")))
+
+
+async def generate_problem_coalesced(keyword: str, strategy: Optional[str] = None) -> dict:
+    return await problem_flight.do(
+        (normalize_keyword(keyword), strategy or PROBLEM_STRATEGY),
+        lambda: generate_problem_cached(keyword, strategy),
+    )
+
+
+PROBLEM_POOL_ENABLED = os.getenv("PROBLEM_POOL_ENABLED", "true").lower() == "true"
+
+problem_pool = ProblemPool(
+    generate=generate_problem,
+    low_watermark=int(os.getenv("PROBLEM_POOL_LOW_WATERMARK", "1")),
+    high_watermark=int(os.getenv("PROBLEM_POOL_HIGH_WATERMARK", "1")),
+    workers=int(os.getenv("PROBLEM_POOL_WORKERS", "2")),
+    max_keywords=int(os.getenv("PROBLEM_POOL_MAX_KEYWORDS", "20")),
+    max_queue=int(os.getenv("PROBLEM_POOL_MAX_QUEUE", "100")),
+)
+
+# 풀이 비어 있어도 진행 중인 리필이 있으면 새로 생성하지 않고 이 시간(초)까지 기다린다
+PROBLEM_POOL_WAIT_TIMEOUT = float(os.getenv("PROBLEM_POOL_WAIT_TIMEOUT", "30"))
+
+
+async def take_pooled_problem(keyword: str, strategy: Optional[str] = None) -> Optional[dict]:
+    # 풀은 기본 생성 방식(PROBLEM_STRATEGY)으로만 채우므로 다른 방식을 요청하면 쓰지 않는다
+    if (strategy or PROBLEM_STRATEGY) != PROBLEM_STRATEGY:
+        return None
+    return await problem_pool.take(keyword, timeout=PROBLEM_POOL_WAIT_TIMEOUT)
+
+
+def track_requested_keyword(keyword: str, strategy: Optional[str] = None):
+    """
+    실제로 문제를 요청받은 키워드 중 서버가 내준 키워드(키워드 풀에 있는 것)만
+    다음 요청을 위해 미리 생성해 둔다. (임의로 POST된 키워드로 리필이 늘어나지 않도록)
+    풀을 쓰지 않는 생성 방식의 요청은 추적하지 않는다.
+    """
+    if (strategy or PROBLEM_STRATEGY) == PROBLEM_STRATEGY and keyword in keyword_pool:
+        problem_pool.track([keyword])
+
+
+# ----------------------------------------------------------------------
+# 8) 시작 준비 (warm-up) / lifespan
+#   첫 플레이어가 클라이언트 생성, 커넥션 연결, 빈 캐시 비용을 치르지 않도록 미리 끝내 둔다.
+#   WARMUP_BLOCKING=true 이면 warm-up이 끝난 뒤에 요청을 받고,
+#   false(기본)이면 바로 요청을 받되 GET /api/ready는 warm-up이 끝날 때까지 503을 돌려준다.
+# ----------------------------------------------------------------------
+WARMUP_BLOCKING = os.getenv("WARMUP_BLOCKING", "false").lower() == "true"
+WARMUP_PRIME_CONNECTIONS = int(os.getenv("WARMUP_PRIME_CONNECTIONS", "1"))
+WARMUP_PREFILL_KEYWORDS = int(os.getenv("WARMUP_PREFILL_KEYWORDS", "0"))
+WARMUP_PREFILL_PROBLEMS = int(os.getenv("WARMUP_PREFILL_PROBLEMS", "0"))
+
+warmup_step_seconds = metrics.gauge(
+    "find_hallucination_warmup_step_seconds", "Seconds spent in each warm-up step", ["step", "outcome"],
+)
+
+warmup = WarmUp(
+    timeout=float(os.getenv("WARMUP_STEP_TIMEOUT", "60")),
+    on_step=lambda step, seconds, outcome: warmup_step_seconds.set(seconds, step=step, outcome=outcome),
+)
+
+
+def warm_up_chains():
+    # 작업마다 route에 있는 모든 모델의 체인을 만든다 (escalation 대상 모델 포함)
+    chain_getters = {
+        "generate_keywords": get_keywords_chain,
+        "generate_keyword_batch": get_keywords_bulk_chain,
+        "generate_right_text": get_right_text_chain,
+        "generate_wrong_text": get_wrong_text_chain,
+        "generate_combined": get_combined_chain,
+    }
+    for operation, get_chain in chain_getters.items():
+        for model in model_router.route(operation):
+            get_chain(model)
+    logging.info(f"[warm_up_chains]: {chain_registry.stats()}")
+
+
+def warm_up_models() -> List[str]:
+    models = {BedrockChatModel.NOVA_PRO.value}
+    for operation in model_router.routes:
+        models.update(model_router.route(operation))
+    return sorted(models)
+
+
+async def start_pools():
+    if PROBLEM_POOL_ENABLED:
+        problem_pool.start()
+    if KEYWORD_POOL_ENABLED:
+        keyword_pool.start()
+
+
+async def wait_until(condition, interval: float = 0.1):
+    while not condition():
+        await asyncio.sleep(interval)
+
+
+async def prefill_keywords():
+    await wait_until(lambda: len(keyword_pool) >= min(WARMUP_PREFILL_KEYWORDS, keyword_pool.target_size))
+
+
+async def prefill_problems():
+    keywords = keyword_pool.draw(WARMUP_PREFILL_PROBLEMS) or KEYWORDS_FALLBACK[:WARMUP_PREFILL_PROBLEMS]
+    problem_pool.track(keywords)
+    await wait_until(lambda: problem_pool.stats()["ready"] >= len(keywords))
+
+
+# 순서대로 실행 (클라이언트 -> 커넥션 -> 백그라운드 풀 -> 캐시 채우기)
+warmup.step("llm_client", lambda: asyncio.to_thread(llm_provider.connect))
+warmup.step("chains", lambda: asyncio.to_thread(warm_up_chains))
+if WARMUP_PRIME_CONNECTIONS > 0:
+    warmup.step(
+        "llm_connections",
+        lambda: asyncio.to_thread(llm_provider.prime, warm_up_models(), WARMUP_PRIME_CONNECTIONS),
+        required=False,
+    )
+if tracer.enabled:
+    warmup.step("tracing_client", lambda: asyncio.to_thread(tracer.connect), required=False)
+warmup.step("pools", start_pools)
+if WARMUP_PREFILL_KEYWORDS > 0 and KEYWORD_POOL_ENABLED:
+    warmup.step("prefill_keywords", prefill_keywords, required=False)
+if WARMUP_PREFILL_PROBLEMS > 0 and PROBLEM_POOL_ENABLED:
+    warmup.step("prefill_problems", prefill_problems, required=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(rankings_store.open)
+    if PROBLEM_CACHE_ENABLED:
+        await asyncio.to_thread(problem_cache.open)
+    tracer.start()
+    if WARMUP_BLOCKING:
+        await warmup.run()
+    else:
+        warmup.start()
+    try:
+        yield
+    finally:
+        await warmup.stop()
+        await problem_pool.stop()
+        await keyword_pool.stop()
+        await asyncio.to_thread(tracer.stop)
+        rankings_store.close()
+        problem_cache.close()
+
+
+# ----------------------------------------------------------------------
+# 9) API 엔드포인트
+# ----------------------------------------------------------------------
+app = FastAPI(lifespan=lifespan)
+
+# CORS 설정 (모든 도메인 허용)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+@app.middleware("http")
+async def record_http_metrics(request: Request, call_next):
+    # 라벨 수가 늘어나지 않도록 등록된 경로만 그대로 쓰고 나머지는 other로 묶는다
+    path = request.url.path if request.url.path in metric_paths() else "other"
+    start = time.perf_counter()
+    status = 500
+    current_endpoint.set(path)
+    with http_in_flight.track(path=path):
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            http_seconds.observe(time.perf_counter() - start, method=request.method, path=path)
+            http_requests.inc(method=request.method, path=path, status=str(status))
+
+
+def metric_paths() -> set:
+    return {route.path for route in app.routes}
+
+
+@app.get("/metrics")
+async def api_metrics():
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+
+@app.get("/api/ready")
+async def api_ready():
+    # readiness probe: warm-up이 끝나기 전에는 503
+    return JSONResponse(warmup.stats(), status_code=200 if warmup.ready else 503)
+
+
 @app.get("/api/keywords")
 async def api_keywords():
-    result = generate_keywords()
+    result = await draw_keywords()
     # TEST 용 stub
     # result = {"keywords":["역사적 사건","문화적 관습","과학적 원리","문학적 작품","지리적 특징"]}
     return result
@@ -286,15 +1134,17 @@ async def api_problem(request: Request):
     keyword = data.get("keyword", "")
     if not keyword:
         raise HTTPException(status_code=400, detail="keyword is required")
-    result = generate_right_text(keyword)
-
-    right_text = result["right_text"]
+    strategy = data.get("strategy") or PROBLEM_STRATEGY
+    if strategy not in PROBLEM_STRATEGIES:
+        raise HTTPException(status_code=400, detail=f"strategy must be one of {PROBLEM_STRATEGIES}")
 
-    # 토큰 수 제약으로 인해 wrong 텍스트 생성 분리
-    wrong_text_response = generate_wrong_text(right_text)
-    wrong_text = wrong_text_response['wrong_text']
-
-    result["wrong_text"] = wrong_text
+    # 풀에 준비된(또는 생성 중인) 문제가 없을 때만 실시간 생성
+    result = await take_pooled_problem(keyword, strategy)
+    if result is None:
+        result = await generate_problem_coalesced(keyword, strategy)
+    if not result:
+        raise HTTPException(status_code=500, detail="problem generation failed")
+    track_requested_keyword(keyword, strategy)
 
     # TEST 용 stub
     # result = {
@@ -339,50 +1189,98 @@ async def api_problem(request: Request):
     return result
 
 
+@app.post("/api/problem/stream")
+async def api_problem_stream(request: Request):
+    data = await request.json()
+    keyword = data.get("keyword", "")
+    if not keyword:
+        raise HTTPException(status_code=400, detail="keyword is required")
+    # right_text를 먼저 보내야 하므로 스트리밍은 split 방식만 지원한다
+    strategy = data.get("strategy") or "split"
+    if strategy != "split":
+        raise HTTPException(status_code=400, detail="streaming supports only the split strategy")
+    return StreamingResponse(
+        stream_problem(keyword),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/pool/stats")
+async def api_pool_stats():
+    return problem_pool.stats()
+
+
+@app.get("/api/keywords/pool/stats")
+async def api_keyword_pool_stats():
+    return keyword_pool.stats()
+
+
+@app.get("/api/prompts")
+async def api_prompts():
+    return prompt_registry.active()
+
+
+@app.get("/api/routing/stats")
+async def api_routing_stats():
+    return model_router.stats()
+
+
+@app.get("/api/flight/stats")
+async def api_flight_stats():
+    return {"keywords": keywords_flight.stats(), "problem": problem_flight.stats()}
+
+
+@app.get("/api/tracing/stats")
+async def api_tracing_stats():
+    return tracer.stats()
+
+
+@app.get("/api/cache/stats")
+async def api_cache_stats():
+    return await asyncio.to_thread(problem_cache.stats)
+
+
 # ---------------------------
-# 8) 랭킹 저장 API (POST) – 10위 초과 시 하위 기록 삭제
+# 10) 랭킹 저장 API (POST) – 10위 초과 시 하위 기록 삭제
 # ---------------------------
 @app.post("/api/rankings")
 async def save_ranking(record: RankingRecord):
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    cursor.execute("INSERT INTO rankings (nickname, keyword, elapsed_time) VALUES (?, ?, ?)",
-                   (record.nickname, record.keyword, record.elapsed_time))
-    conn.commit()
-    # 전체 기록을 걸린 시간 순으로 정렬 후, 10위 밖 기록 삭제
-    cursor.execute("SELECT id FROM rankings ORDER BY elapsed_time ASC")
-    rows = cursor.fetchall()
-    if len(rows) > 10:
-        for row in rows[10:]:
-            cursor.execute("DELETE FROM rankings WHERE id = ?", (row[0],))
-        conn.commit()
-    conn.close()
+    with stage_seconds.time(operation="save_ranking", stage="total"):
+        try:
+            await asyncio.to_thread(timed_call, "save_ranking", "sqlite_write",
+                                    rankings_store.save, record.nickname, record.keyword, record.elapsed_time)
+        except sqlite3.OperationalError as e:
+            # 부하 테스트(--url)에서도 서버 쪽 lock 에러 수를 읽을 수 있도록 집계
+            if "locked" in str(e):
+                sqlite_lock_errors.inc(operation="save_ranking")
+            raise
     return {"status": "ok"}
 
 
 # ---------------------------
-# 9) 랭킹 조회 API (GET) – 순위, 닉네임, 키워드, 걸린 시간 반환
+# 11) 랭킹 조회 API (GET) – 순위, 닉네임, 키워드, 걸린 시간 반환
 # ---------------------------
+RANKINGS_CACHE_MAX_AGE = int(os.getenv("RANKINGS_CACHE_MAX_AGE", "5"))
+
+
 @app.get("/api/rankings")
-async def get_rankings():
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT nickname, keyword, elapsed_time FROM rankings ORDER BY elapsed_time ASC LIMIT 10")
-    rows = cursor.fetchall()
-    conn.close()
-    rankings_list = []
-    for idx, row in enumerate(rows):
-        rankings_list.append({
-            "rank": idx + 1,
-            "nickname": row[0],
-            "keyword": row[1],
-            "elapsed_time": row[2]
-        })
-    return {"rankings": rankings_list}
+async def get_rankings(request: Request):
+    # 메모리의 상위 목록을 그대로 사용하고, 바뀌지 않았으면 304 반환
+    # (다른 프로세스의 쓰기를 반영하도록 refresh_interval마다 DB에서 다시 읽는다)
+    if rankings_store.stale:
+        await asyncio.to_thread(rankings_store.refresh)
+    with stage_seconds.time(operation="get_rankings", stage="snapshot"):
+        etag, rankings_list = rankings_store.snapshot()
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={RANKINGS_CACHE_MAX_AGE}"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return JSONResponse({"rankings": rankings_list}, headers=headers)
 
 
 # ----------------------------------------------------------------------
-# 10) Uvicorn 실행
+# 12) Uvicorn 실행
 # ----------------------------------------------------------------------
 if __name__ == '__main__':
     import uvicorn
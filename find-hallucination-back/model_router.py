@@ -0,0 +1,104 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+# 검증 함수: 통과하면 None, 실패하면 실패 사유 문자열 ("schema", "count", ...)
+Validator = Callable[[Any], Optional[str]]
+
+
+class EscalationExhausted(Exception):
+    """
+    마지막 모델의 결과까지 검증에 실패했을 때 발생한다.
+    result에 마지막(검증 실패) 결과를 담아 두므로, 일부라도 살릴 수 있는 호출 측은 꺼내 쓸 수 있다.
+    """
+
+    def __init__(self, operation: str, reason: str, result: Any = None):
+        super().__init__(f"{operation}: all models failed validation ({reason})")
+        self.operation = operation
+        self.reason = reason
+        self.result = result
+
+
+class ModelRouter:
+    """
+    작업(operation)별로 시도할 모델 순서를 정하고, 결과 검증에 실패하면 다음(더 큰) 모델로 넘긴다.
+
+    - routes에 없는 작업은 default 모델 하나만 사용
+    - 각 시도의 모델별 지연 시간과 결과(ok / 실패 사유), 작업별 escalation 횟수를 집계
+    - 마지막 모델까지 실패하면 검증에 실패한 결과를 돌려주지 않는다.
+      마지막 시도가 예외였다면 그 예외를, 검증 실패였다면 EscalationExhausted를 발생시킨다.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, Sequence[str]],
+        default: str,
+        on_attempt: Optional[Callable[[str, str, float, str], None]] = None,
+    ):
+        self.routes = {operation: list(models) for operation, models in routes.items() if models}
+        self.default = default
+        self._on_attempt = on_attempt
+
+        # 통계: (operation, model) -> {"attempts", "seconds", outcome: count}
+        self._attempts: Dict[tuple, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._escalations: Dict[str, int] = defaultdict(int)
+        self._calls: Dict[str, int] = defaultdict(int)
+
+    def route(self, operation: str) -> List[str]:
+        return self.routes.get(operation) or [self.default]
+
+    async def run(self, operation: str, call: Callable[[str], Awaitable[Any]], validate: Validator):
+        """
+        route(operation)의 모델 순서대로 call(model)을 실행하고 validate를 통과한 첫 결과를 돌려준다.
+        """
+        models = self.route(operation)
+        self._calls[operation] += 1
+        result = None
+        error = None
+        outcome = "error"
+        for index, model in enumerate(models):
+            start = time.perf_counter()
+            try:
+                result = await call(model)
+                error = None
+                outcome = validate(result) or "ok"
+            except Exception as e:
+                result, error, outcome = None, e, "error"
+            self._record(operation, model, time.perf_counter() - start, outcome)
+            if outcome == "ok":
+                return result
+            if index < len(models) - 1:
+                self._escalations[operation] += 1
+                logging.warning(f"[ModelRouter] {operation}: {model} -> {models[index + 1]} ({outcome})")
+
+        if error is not None:
+            raise error
+        raise EscalationExhausted(operation, outcome, result)
+
+    def stats(self) -> dict:
+        operations = {}
+        for (operation, model), counters in sorted(self._attempts.items()):
+            attempts = counters["attempts"]
+            entry = operations.setdefault(operation, {
+                "route": self.route(operation),
+                "calls": self._calls[operation],
+                "escalations": self._escalations[operation],
+                "escalation_rate": round(self._escalations[operation] / self._calls[operation], 4)
+                if self._calls[operation] else 0.0,
+                "models": {},
+            })
+            entry["models"][model] = {
+                "attempts": int(attempts),
+                "avg_seconds": round(counters["seconds"] / attempts, 3) if attempts else 0.0,
+                "outcomes": {key: int(value) for key, value in counters.items() if key not in ("attempts", "seconds")},
+            }
+        return operations
+
+    def _record(self, operation: str, model: str, seconds: float, outcome: str):
+        counters = self._attempts[(operation, model)]
+        counters["attempts"] += 1
+        counters["seconds"] += seconds
+        counters[outcome] += 1
+        if self._on_attempt is not None:
+            self._on_attempt(operation, model, seconds, outcome)
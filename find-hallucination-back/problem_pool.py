@@ -0,0 +1,258 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional
+
+
+def normalize_keyword(keyword: str) -> str:
+    """
+    키워드 비교용 정규화 (앞뒤 공백 제거, 연속 공백 축약, 대소문자 무시)
+    """
+    return " ".join(keyword.split()).casefold()
+
+
+class ProblemPool:
+    """
+    키워드별로 미리 생성해 둔 문제를 보관하는 풀.
+
+    - 풀의 문제 수가 low_watermark 미만으로 떨어지면 high_watermark까지 채우도록
+      리필 작업을 큐에 넣고, refill worker(asyncio task)들이 백그라운드에서 생성한다.
+    - 추적하는 키워드 수는 max_keywords로 제한하며, 가장 오래 사용되지 않은 키워드부터 제거한다.
+    - 리필 큐는 max_queue개까지만 받고, 가득 차면 새 리필 요청은 버린다.
+    - take(): 풀이 비어 있어도 진행 중인 리필이 있으면 새로 생성하지 않고 그 결과를 기다린다.
+    - key_func를 바꾸면 키워드 대신 카테고리 등 다른 기준으로 풀을 묶을 수 있다.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str], Awaitable[dict]],
+        low_watermark: int = 1,
+        high_watermark: int = 2,
+        workers: int = 2,
+        max_keywords: int = 20,
+        max_queue: int = 100,
+        key_func: Callable[[str], str] = normalize_keyword,
+    ):
+        if low_watermark < 1 or high_watermark < low_watermark:
+            raise ValueError("1 <= low_watermark <= high_watermark 이어야 합니다.")
+        self._generate = generate
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.workers = workers
+        self.max_keywords = max_keywords
+        self.max_queue = max_queue
+        self._key_func = key_func
+
+        self._pools: "OrderedDict[str, Deque[dict]]" = OrderedDict()
+        self._pending: Dict[str, int] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+        # 리필 결과를 기다리는 요청 (key -> Future 목록)
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._refill_failures = 0
+        self._waited = 0
+        self._wait_hits = 0
+        self._dropped = 0
+        self._refill_lags: Deque[float] = deque(maxlen=100)
+        self._pending_since: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._pending.clear()
+        self._pending_since.clear()
+        for key in list(self._waiters):
+            self._wake(key, None)
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def track(self, keywords: Iterable[str]):
+        """
+        키워드를 풀 관리 대상으로 등록하고, 부족하면 리필을 예약한다.
+        호출할 때마다 백그라운드 생성이 생기므로 실제로 다시 요청될 키워드에만 사용한다.
+        """
+        for keyword in keywords:
+            key = self._key_func(keyword)
+            if not key:
+                continue
+            if key in self._pools:
+                self._pools.move_to_end(key)
+            else:
+                self._pools[key] = deque()
+                self._evict()
+            self._maybe_refill(key, keyword)
+
+    def get(self, keyword: str) -> Optional[dict]:
+        """
+        풀에서 문제를 하나 꺼낸다. 없으면 None (호출 측에서 실시간 생성).
+        꺼낸 뒤 low_watermark 아래로 내려가면 리필을 예약한다. (추적 중이 아닌 키워드는 등록하지 않음)
+        """
+        problem = self._pop(keyword)
+        self._count(problem)
+        return problem
+
+    async def take(self, keyword: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        get()과 같지만, 풀이 비어 있고 이 키워드의 리필이 진행 중이면 그 결과를 기다린다.
+        (같은 키워드를 실시간 생성과 리필이 두 번 만들지 않도록) 리필이 실패하거나 timeout이 지나면 None.
+        hit/miss는 기다린 뒤의 결과로 한 번만 센다. (기다려서 받은 경우는 wait_hits에도 센다)
+        """
+        problem = self._pop(keyword)
+        key = self._key_func(keyword)
+        if problem is not None or not self._pending.get(key):
+            self._count(problem)
+            return problem
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(waiter)
+        self._waited += 1
+        try:
+            problem = await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            problem = None
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[key]
+        self._count(problem)
+        if problem is not None:
+            self._wait_hits += 1
+        return problem
+
+    def _pop(self, keyword: str) -> Optional[dict]:
+        key = self._key_func(keyword)
+        pool = self._pools.get(key)
+        problem = pool.popleft() if pool else None
+        if problem is not None:
+            self._pools.move_to_end(key)
+            self._maybe_refill(key, keyword)
+        return problem
+
+    def _count(self, problem: Optional[dict]):
+        if problem is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        total = self._hits + self._misses
+        lags = list(self._refill_lags)
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            "keywords": len(self._pools),
+            "ready": sum(len(p) for p in self._pools.values()),
+            "pending": sum(self._pending.values()),
+            "queue_size": self._queue.qsize() if self._queue else 0,
+            "refill_failures": self._refill_failures,
+            "waited": self._waited,
+            "wait_hits": self._wait_hits,
+            "dropped": self._dropped,
+            "refill_lag_avg": round(sum(lags) / len(lags), 3) if lags else 0.0,
+            "refill_lag_max": round(max(lags), 3) if lags else 0.0,
+            "oldest_pending_age": round(now - min(self._pending_since.values()), 3)
+            if self._pending_since else 0.0,
+            "low_watermark": self.low_watermark,
+            "high_watermark": self.high_watermark,
+        }
+
+    # ------------------------------------------------------------------
+    # internal
+    # ------------------------------------------------------------------
+    def _evict(self):
+        while len(self._pools) > self.max_keywords:
+            key, _ = self._pools.popitem(last=False)
+            logging.info(f"[ProblemPool] evict keyword: {key}")
+
+    def _maybe_refill(self, key: str, keyword: str):
+        if self._queue is None:
+            return
+        size = len(self._pools[key])
+        pending = self._pending.get(key, 0)
+        if size >= self.low_watermark or pending:
+            return
+        enqueued_at = time.monotonic()
+        enqueued = 0
+        for _ in range(self.high_watermark - size):
+            try:
+                self._queue.put_nowait((key, keyword, enqueued_at))
+            except asyncio.QueueFull:
+                self._dropped += 1
+                break
+            enqueued += 1
+        if enqueued:
+            self._pending[key] = enqueued
+            self._pending_since[key] = enqueued_at
+
+    def _finish(self, key: str):
+        remaining = self._pending.get(key, 0) - 1
+        if remaining > 0:
+            self._pending[key] = remaining
+        else:
+            self._pending.pop(key, None)
+            self._pending_since.pop(key, None)
+            # 더 이상 진행 중인 리필이 없으므로 남은 대기자는 실시간 생성으로 넘어간다
+            self._wake(key, None)
+
+    def _wake(self, key: str, problem: Optional[dict]) -> bool:
+        """
+        key를 기다리는 요청이 있으면 하나에게 problem을 넘긴다(problem이 None이면 모두 깨운다).
+        """
+        waiters = self._waiters.get(key)
+        while waiters:
+            waiter = waiters.pop(0)
+            if waiter.done():
+                continue
+            waiter.set_result(problem)
+            if problem is not None:
+                if not waiters:
+                    del self._waiters[key]
+                return True
+        self._waiters.pop(key, None)
+        return False
+
+    async def _worker(self, worker_id: int):
+        while True:
+            key, keyword, enqueued_at = await self._queue.get()
+            try:
+                if key not in self._pools:
+                    # 이미 제거된 키워드
+                    continue
+                try:
+                    problem = await self._generate(keyword)
+                except Exception as e:
+                    logging.error(f"[ProblemPool] worker {worker_id} error: {e}")
+                    problem = None
+                if not problem:
+                    self._refill_failures += 1
+                    continue
+                self._refill_lags.append(time.monotonic() - enqueued_at)
+                if self._wake(key, problem):
+                    continue
+                pool = self._pools.get(key)
+                if pool is not None and len(pool) < self.high_watermark:
+                    pool.append(problem)
+            finally:
+                self._finish(key)
+                self._queue.task_done()
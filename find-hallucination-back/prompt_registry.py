@@ -0,0 +1,89 @@
+import threading
+from typing import Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+
+class PromptVersion:
+    """
+    하나의 프롬프트 버전 (system/human 템플릿 + 응답 스키마)
+
+    - format_instructions: None이면 JsonOutputParser.get_format_instructions()(JSON schema 전체)를 사용하고,
+      문자열이면 system 템플릿의 {format_instructions} 자리에 그대로 넣는다. (짧은 JSON 예시 등)
+    - cacheable: system 메시지(정적인 앞부분)를 공급자의 prompt cache 대상으로 표시한다.
+      이 경우 system은 템플릿이 아닌 고정 문자열로 다루므로 {format_instructions} 외의 변수나
+      중괄호 이스케이프({{ }})를 쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        system: str,
+        human: str,
+        response_model: Type[BaseModel],
+        format_instructions: Optional[str] = None,
+        cacheable: bool = False,
+    ):
+        self.name = name
+        self.version = version
+        self.system = system
+        self.human = human
+        self.response_model = response_model
+        self.format_instructions = format_instructions
+        self.cacheable = cacheable
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}:{self.version}"
+
+
+class PromptRegistry:
+    """
+    이름별로 여러 버전의 프롬프트를 등록하고, 이름마다 현재 사용할(active) 버전을 하나 고른다.
+    처음 등록된 버전이 기본 active 버전이 된다.
+    """
+
+    def __init__(self):
+        self._prompts: Dict[str, Dict[str, PromptVersion]] = {}
+        self._active: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def register(self, prompt: PromptVersion) -> PromptVersion:
+        with self._lock:
+            versions = self._prompts.setdefault(prompt.name, {})
+            if prompt.version in versions:
+                raise ValueError(f"prompt already registered: {prompt.label}")
+            versions[prompt.version] = prompt
+            self._active.setdefault(prompt.name, prompt.version)
+        return prompt
+
+    def get(self, name: str, version: Optional[str] = None) -> PromptVersion:
+        versions = self._prompts.get(name)
+        if not versions:
+            raise KeyError(f"unknown prompt: {name}")
+        version = version or self._active[name]
+        if version not in versions:
+            raise KeyError(f"unknown prompt version: {name}:{version}")
+        return versions[version]
+
+    def activate(self, name: str, version: str):
+        self.get(name, version)
+        with self._lock:
+            self._active[name] = version
+
+    def activate_all(self, spec: str):
+        """
+        "right_text=v2-compact,wrong_text=v2-compact" 형식의 설정을 적용한다.
+        """
+        for item in spec.split(","):
+            if "=" not in item:
+                continue
+            name, version = (part.strip() for part in item.split("=", 1))
+            self.activate(name, version)
+
+    def versions(self, name: str) -> List[str]:
+        return list(self._prompts.get(name, {}))
+
+    def active(self) -> Dict[str, str]:
+        return dict(self._active)
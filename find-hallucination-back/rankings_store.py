@@ -0,0 +1,146 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class RankingsStore:
+    """
+    랭킹 저장소 (SQLite)
+
+    - 프로세스 동안 연결 하나를 유지하고 쓰기 lock으로 직렬화 (매 요청마다 connect 하지 않음)
+    - WAL 모드 + elapsed_time 인덱스
+    - 상위 limit개를 넘는 기록은 DELETE 한 번으로 정리
+    - 상위 limit개는 메모리에도 유지하여 조회 시 DB를 읽지 않는다.
+      쓰기 트랜잭션은 별도 lock에서 끝내고, (etag, 상위 목록)은 짧은 lock 안에서 통째로 교체하므로
+      snapshot()은 쓰기를 기다리지 않는다. (이벤트 루프에서 바로 호출해도 된다)
+    - etag는 상위 목록의 id로 만들므로 같은 DB를 보는 프로세스끼리는 같은 값이 나온다.
+      다른 프로세스의 쓰기는 refresh_interval초마다 refresh()로 다시 읽어 반영한다.
+    - snapshot()을 제외한 메서드는 동기 함수이므로 async 엔드포인트에서는 asyncio.to_thread로 호출한다
+    """
+
+    def __init__(self, path: str, limit: int = 10, timeout: float = 5.0, refresh_interval: float = 5.0):
+        self.path = path
+        self.limit = limit
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        # 연결/쓰기 트랜잭션용 lock
+        self._write_lock = threading.Lock()
+        # (etag, 상위 목록) 교체용 짧은 lock
+        self._lock = threading.Lock()
+        # (elapsed_time, id, nickname, keyword) 정렬 튜플
+        self._top: Tuple[Tuple[float, int, str, str], ...] = ()
+        self._etag = top_etag(self._top)
+        self._loaded_at = 0.0
+
+    def open(self):
+        with self._write_lock:
+            if self._conn is not None:
+                return
+            conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS rankings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nickname TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    elapsed_time REAL NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_rankings_elapsed_time ON rankings (elapsed_time, id)")
+            conn.commit()
+            self._conn = conn
+            self._swap(self._read_top())
+
+    def close(self):
+        with self._write_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def etag(self) -> str:
+        return self._etag
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self._loaded_at >= self.refresh_interval
+
+    def _read_top(self) -> Tuple[Tuple[float, int, str, str], ...]:
+        rows = self._conn.execute(
+            "SELECT elapsed_time, id, nickname, keyword FROM rankings ORDER BY elapsed_time ASC, id ASC LIMIT ?",
+            (self.limit,),
+        ).fetchall()
+        return tuple(tuple(row) for row in rows)
+
+    def _swap(self, top: Tuple[Tuple[float, int, str, str], ...]):
+        etag = top_etag(top)
+        with self._lock:
+            self._top = top
+            self._etag = etag
+            self._loaded_at = time.monotonic()
+
+    def save(self, nickname: str, keyword: str, elapsed_time: float):
+        self.open()
+        with self._write_lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO rankings (nickname, keyword, elapsed_time) VALUES (?, ?, ?)",
+                    (nickname, keyword, elapsed_time),
+                )
+                # 걸린 시간 순 상위 limit개를 제외한 기록 삭제
+                self._conn.execute(
+                    "DELETE FROM rankings WHERE id NOT IN "
+                    "(SELECT id FROM rankings ORDER BY elapsed_time ASC, id ASC LIMIT ?)",
+                    (self.limit,),
+                )
+                # 남은 기록은 limit개 이하이므로 다시 읽어도 싸다 (다른 프로세스의 쓰기도 함께 반영)
+                top = self._read_top()
+        self._swap(top)
+
+    def refresh(self):
+        """
+        다른 프로세스가 쓴 기록을 반영하도록 상위 목록을 DB에서 다시 읽는다.
+        """
+        self.open()
+        with self._write_lock:
+            top = self._read_top()
+        self._swap(top)
+
+    def top(self, limit: Optional[int] = None) -> List[dict]:
+        with self._lock:
+            entries = self._top
+        return to_rankings_list(entries[:limit or self.limit])
+
+    def snapshot(self) -> Tuple[str, List[dict]]:
+        """
+        (etag, 상위 목록)을 한 번에 반환 (DB 조회 없음)
+        """
+        with self._lock:
+            etag = self._etag
+            entries = self._top
+        return etag, to_rankings_list(entries)
+
+
+def top_etag(entries) -> str:
+    """
+    상위 목록의 id 순서로 만든 etag (기록은 수정되지 않으므로 id만으로 내용이 정해진다)
+    """
+    ids = ",".join(str(entry[1]) for entry in entries)
+    return f'"{hashlib.sha1(ids.encode()).hexdigest()[:16]}"'
+
+
+def to_rankings_list(entries) -> List[dict]:
+    rankings_list = []
+    for idx, (elapsed_time, _, nickname, keyword) in enumerate(entries):
+        rankings_list.append({
+            "rank": idx + 1,
+            "nickname": nickname,
+            "keyword": keyword,
+            "elapsed_time": elapsed_time
+        })
+    return rankings_list
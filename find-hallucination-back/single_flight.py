@@ -0,0 +1,67 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 요청들이 하나의 생성 작업을 공유하도록 묶는다. (single-flight)
+
+    - 처음 들어온 요청(leader)만 func를 실행하고, 실행 중에 들어온 같은 key의 요청은 그 결과를 기다린다.
+    - 작업은 별도 task로 실행하므로 leader 요청이 취소되어도 기다리는 다른 요청에는 영향이 없다.
+    - reuse_window(초) 동안은 끝난 작업의 결과를 그대로 재사용한다. 예외나 빈 결과는 재사용하지 않는다.
+    """
+
+    def __init__(self, reuse_window: float = 0.0, max_entries: int = 256):
+        self.reuse_window = reuse_window
+        self.max_entries = max_entries
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._recent: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        # 통계
+        self._leaders = 0
+        self._shared = 0
+        self._reused = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]):
+        recent = self._recent.get(key)
+        if recent is not None:
+            expires_at, result = recent
+            if time.monotonic() < expires_at:
+                self._reused += 1
+                return result
+            del self._recent[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self._leaders += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._shared += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if self.reuse_window > 0 and result:
+            self._recent[key] = (time.monotonic() + self.reuse_window, result)
+            self._recent.move_to_end(key)
+            while len(self._recent) > self.max_entries:
+                self._recent.popitem(last=False)
+
+    def stats(self) -> dict:
+        total = self._leaders + self._shared + self._reused
+        return {
+            "reuse_window": self.reuse_window,
+            "in_flight": len(self._in_flight),
+            "leaders": self._leaders,
+            "shared": self._shared,
+            "reused": self._reused,
+            "coalesce_rate": round((self._shared + self._reused) / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,197 @@
+"""
+요청 경로를 막지 않는 LLM 호출 trace 전송기 (Langfuse)
+
+- 요청 처리 중에는 샘플링 여부만 결정하고, 호출 결과(시간/토큰/입출력)를 dict로 모아 큐에 넣기만 한다.
+- 큐는 크기가 제한되어 있으며 가득 차면 기다리지 않고 버린다. (dropped 통계에 집계)
+- 백그라운드 스레드가 batch_size 또는 flush_interval 단위로 꺼내 Langfuse로 보낸다.
+  Langfuse 클라이언트 생성과 입출력 직렬화도 이 스레드에서만 수행한다.
+- disabled_endpoints에 포함된 엔드포인트에서 시작된 호출은 trace하지 않는다.
+"""
+import logging
+import queue
+import random
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# 현재 요청의 엔드포인트 (HTTP 미들웨어에서 설정, 요청 밖의 백그라운드 작업은 "background")
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="background")
+
+
+def to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def prompt_messages(prompt_value) -> Any:
+    if prompt_value is None:
+        return None
+    try:
+        return [{"role": message.type, "content": message.content} for message in prompt_value.to_messages()]
+    except AttributeError:
+        return str(prompt_value)
+
+
+class TraceExporter:
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        max_queue: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 2.0,
+        disabled_endpoints: Iterable[str] = (),
+        tags: Iterable[str] = (),
+    ):
+        self._client_factory = client_factory
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.disabled_endpoints = {endpoint.strip() for endpoint in disabled_endpoints if endpoint.strip()}
+        self.tags = list(tags)
+
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=max_queue)
+        self._client = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+        # 통계
+        self._sampled = 0
+        self._skipped = 0
+        self._dropped = 0
+        self._exported = 0
+        self._failed = 0
+
+    # ------------------------------------------------------------------
+    # 요청 경로 (가볍게 유지)
+    # ------------------------------------------------------------------
+    def start_trace(self, name: str, inputs: dict) -> Optional[dict]:
+        """
+        trace 대상이면 기록용 dict를, 아니면 None을 돌려준다.
+        """
+        endpoint = current_endpoint.get()
+        if not self.enabled or endpoint in self.disabled_endpoints or random.random() >= self.sample_rate:
+            self._skipped += 1
+            return None
+        self._sampled += 1
+        return {"name": name, "endpoint": endpoint, "inputs": inputs, "start": time.time(), "stages": {}}
+
+    def finish_trace(self, record: Optional[dict], error: Optional[BaseException] = None):
+        if record is None:
+            return
+        record["end"] = time.time()
+        if error is not None:
+            record["error"] = repr(error)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        if not self.enabled or self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def connect(self):
+        """
+        Langfuse 클라이언트를 미리 만든다. (첫 export 때 import/생성 비용을 치르지 않도록)
+        """
+        if self.enabled and self._client is None:
+            self._client = self._client_factory()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        남은 trace를 보내고 스레드를 종료한다. (timeout이 지나면 남은 것은 버린다)
+        """
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "disabled_endpoints": sorted(self.disabled_endpoints),
+            "sampled": self._sampled,
+            "skipped": self._skipped,
+            "queued": self._queue.qsize(),
+            "dropped": self._dropped,
+            "exported": self._exported,
+            "failed": self._failed,
+        }
+
+    # ------------------------------------------------------------------
+    # background thread
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._export_batch(batch)
+            elif self._stopping.is_set():
+                return
+
+    def _next_batch(self) -> list:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0 or (self._stopping.is_set() and self._queue.empty()):
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(timeout, 0.1) if self._stopping.is_set() else timeout))
+            except queue.Empty:
+                continue
+        return batch
+
+    def _export_batch(self, batch: list):
+        try:
+            if self._client is None:
+                self._client = self._client_factory()
+            for record in batch:
+                self._export(self._client, record)
+            self._client.flush()
+            self._exported += len(batch)
+        except Exception as e:
+            self._failed += len(batch)
+            logging.error(f"[TraceExporter] export error: {e}")
+
+    def _export(self, client, record: Dict[str, Any]):
+        stages = record["stages"]
+        output = record.get("output")
+        trace = client.trace(
+            name=record["name"],
+            input=record["inputs"],
+            output=output,
+            tags=self.tags,
+            metadata={"endpoint": record["endpoint"], "stages": stages},
+            timestamp=to_datetime(record["start"]),
+        )
+        usage = record.get("usage") or {}
+        trace.generation(
+            name=record["name"],
+            model=record.get("model"),
+            input=prompt_messages(record.get("prompt")),
+            output=output,
+            start_time=to_datetime(record.get("generation_start", record["start"])),
+            completion_start_time=to_datetime(record.get("first_token")),
+            end_time=to_datetime(record["end"]),
+            usage_details={
+                "input": usage.get("input_tokens", 0),
+                "output": usage.get("output_tokens", 0),
+            } if usage else None,
+            level="ERROR" if record.get("error") else None,
+            status_message=record.get("error"),
+        )
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class WarmUp:
+    """
+    서버 시작 후 첫 요청 전에 끝내 둘 준비 작업(클라이언트 생성, 커넥션 준비, 캐시 채우기 등)을 순서대로 실행한다.
+
+    - required 단계가 하나라도 실패하면 ready가 되지 않는다. (readiness 검사에서 계속 503)
+    - optional 단계의 실패는 기록만 하고 넘어간다. (없어도 동작은 하지만 첫 요청이 느려지는 작업)
+    - 각 단계의 소요 시간과 결과를 stats()로 돌려준다.
+    """
+
+    def __init__(self, timeout: Optional[float] = None,
+                 on_step: Optional[Callable[[str, float, str], None]] = None):
+        self.timeout = timeout
+        self._on_step = on_step
+        self._steps: List[tuple] = []
+        self._results: Dict[str, dict] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._started_at: Optional[float] = None
+        self._seconds: Optional[float] = None
+
+    def step(self, name: str, func: Callable[[], Awaitable[None]], required: bool = True):
+        self._steps.append((name, func, required))
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.ready
+
+    async def run(self) -> bool:
+        self._started_at = time.monotonic()
+        failed = []
+        for name, func, required in self._steps:
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(func(), self.timeout)
+                outcome = "ok"
+            except Exception as e:
+                outcome = "timeout" if isinstance(e, asyncio.TimeoutError) else "error"
+                logging.error(f"[WarmUp] {name} {outcome}: {e!r}")
+                if required:
+                    failed.append(name)
+            seconds = time.perf_counter() - start
+            self._results[name] = {"required": required, "outcome": outcome, "seconds": round(seconds, 3)}
+            if self._on_step is not None:
+                self._on_step(name, seconds, outcome)
+
+        self._seconds = time.monotonic() - self._started_at
+        if failed:
+            logging.error(f"[WarmUp] not ready, failed: {failed}")
+            return False
+        self._ready.set()
+        logging.info(f"[WarmUp] ready in {self._seconds:.2f}s")
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "running": self._task is not None and not self._task.done(),
+            "seconds": round(self._seconds, 3) if self._seconds is not None else None,
+            "uptime": round(time.monotonic() - self._started_at, 3) if self._started_at is not None else None,
+            "steps": {
+                name: self._results.get(name, {"required": required, "outcome": "pending"})
+                for name, _, required in self._steps
+            },
+        }
@@ -0,0 +1,137 @@
+"""
+pygame 클라이언트 시작 시간 측정 및 예산(budget) 검사 - 창/오디오 장치 없이(SDL dummy 드라이버) 실행
+
+    cd find-hallucination
+    python benchmarks/startup_budget.py --runs 5 --import-budget-ms 400 --first-frame-budget-ms 800 --out result.json
+
+새 프로세스에서 매번 처음부터 측정한다.
+- import: `python -X importtime -c "import main"`의 main 누적 import 시간
+- heavy modules: `import main` 직후 이미 올라와 있는 무거운 모듈 (langchain, boto3, langfuse ...) -> 있으면 실패
+- first frame: 프로세스 시작부터 main.main()이 첫 pygame.display.update()를 호출할 때까지
+
+중앙값이 예산을 넘거나 무거운 모듈이 import되어 있으면 exit code 1 (CI에서 그대로 사용)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 첫 프레임 전에 import되면 안 되는 모듈 (llm.py가 백그라운드에서 불러온다)
+HEAVY_MODULES = [
+    "langchain",
+    "langchain_core",
+    "langchain_aws",
+    "langchain_openai",
+    "boto3",
+    "botocore",
+    "langfuse",
+    "pydantic",
+    "llm",
+]
+
+HEAVY_MODULES_SCRIPT = """
+import json, sys
+import main
+print(json.dumps(sorted(name for name in {modules!r} if name in sys.modules)))
+"""
+
+# 첫 display.update()에서 경과 시간을 출력하고 바로 종료한다
+FIRST_FRAME_SCRIPT = """
+import os, time
+start = time.perf_counter()
+import pygame
+
+def first_frame(*args):
+    print(round((time.perf_counter() - start) * 1000, 2), flush=True)
+    os._exit(0)
+
+pygame.display.update = first_frame
+pygame.display.flip = first_frame
+import main
+if not os.path.exists(main.FONT_PATH):
+    main.FONT_PATH = None  # 폰트 파일이 없는 환경(CI)에서는 pygame 기본 폰트
+main.main()
+"""
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    return env
+
+
+def run_python(args) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=CLIENT_DIR,
+        env=child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_import_ms() -> float:
+    # -X importtime 출력: "import time: self [us] | cumulative | imported package"
+    stderr = run_python(["-X", "importtime", "-c", "import main"]).stderr
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "main":
+            return int(parts[1]) / 1000
+    raise RuntimeError("main not found in -X importtime output")
+
+
+def heavy_modules_after_import() -> list:
+    stdout = run_python(["-c", HEAVY_MODULES_SCRIPT.format(modules=HEAVY_MODULES)]).stdout
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+def measure_first_frame_ms() -> float:
+    stdout = run_python(["-c", FIRST_FRAME_SCRIPT]).stdout
+    return float(stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pygame 클라이언트 시작 시간 예산 검사")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=400.0)
+    parser.add_argument("--first-frame-budget-ms", type=float, default=800.0)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    import_ms = [measure_import_ms() for _ in range(args.runs)]
+    first_frame_ms = [measure_first_frame_ms() for _ in range(args.runs)]
+    heavy = heavy_modules_after_import()
+
+    result = {
+        "runs": args.runs,
+        "import_ms": {"median": round(statistics.median(import_ms), 2), "max": round(max(import_ms), 2)},
+        "first_frame_ms": {"median": round(statistics.median(first_frame_ms), 2), "max": round(max(first_frame_ms), 2)},
+        "heavy_modules": heavy,
+        "budget": {"import_ms": args.import_budget_ms, "first_frame_ms": args.first_frame_budget_ms},
+    }
+
+    failures = []
+    if result["import_ms"]["median"] > args.import_budget_ms:
+        failures.append(f"import {result['import_ms']['median']}ms > {args.import_budget_ms}ms")
+    if result["first_frame_ms"]["median"] > args.first_frame_budget_ms:
+        failures.append(f"first frame {result['first_frame_ms']['median']}ms > {args.first_frame_budget_ms}ms")
+    if heavy:
+        failures.append(f"heavy modules imported before first frame: {', '.join(heavy)}")
+    result["failures"] = failures
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import heapq
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from scores import ScoreLog, is_ranked
+
+LEADERBOARD_INDEX_PATH = "data/scores_index.json"
+GLOBAL_SCOPE = "*"
+
+
+class Leaderboard:
+    """
+    로컬 게임 기록(JSONL)에 대한 top-K 인덱스.
+
+    - 전체/키워드별로 크기 k의 heap과 시간 히스토그램만 유지 (기록 수와 무관한 크기)
+    - 인덱스는 사이드카 파일(scores_index.json)에 저장하고, 로그에서 마지막으로 읽은 위치(offset)
+      이후에 추가된 줄만 읽어 갱신한다. 로그가 compact되어 파일이 바뀌면 처음부터 다시 만든다.
+    - rank(): top-K 안이면 정확한 순위, 밖이면 bucket_seconds 단위 히스토그램으로 추정한 순위
+      (같은 구간의 기록은 절반이 앞에 있다고 본다). rank_label()은 추정이면 "약 N위"로 표시한다.
+    """
+
+    def __init__(
+        self,
+        score_log: ScoreLog,
+        index_path: str = LEADERBOARD_INDEX_PATH,
+        k: int = 10,
+        bucket_seconds: float = 1.0,
+        max_buckets: int = 600,
+    ):
+        self.score_log = score_log
+        self.index_path = index_path
+        self.k = k
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self._reset()
+        self._load()
+
+    # ------------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------------
+    def refresh(self):
+        """
+        로그에 새로 추가된 기록만 읽어 인덱스를 갱신한다.
+        """
+        try:
+            st = os.stat(self.score_log.path)
+        except FileNotFoundError:
+            if self._offset:
+                self._reset()
+                self._save()
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # compact 등으로 파일이 교체됨 -> 처음부터 다시 읽는다
+            self._reset()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return
+
+        with open(self.score_log.path, "rb") as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 아직 쓰는 중인 줄
+                self._offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._add(record)
+        self._save()
+
+    def top(self, keyword: Optional[str] = None, k: Optional[int] = None) -> List[dict]:
+        board = self._boards.get(keyword or GLOBAL_SCOPE)
+        if board is None:
+            return []
+        entries = sorted((-neg_time, record_id, kw) for neg_time, record_id, kw in board["heap"])
+        return [
+            {"rank": idx + 1, "keyword": kw, "time": elapsed_time, "id": record_id}
+            for idx, (elapsed_time, record_id, kw) in enumerate(entries[:k or self.k])
+        ]
+
+    def rank(self, elapsed_time: float, keyword: Optional[str] = None) -> int:
+        """
+        elapsed_time 기록의 순위 (1부터). 같은 시간은 동순위.
+        top-K 밖이면 히스토그램으로 추정한 값이다. (is_exact_rank 참고)
+        """
+        board = self._boards.get(keyword or GLOBAL_SCOPE)
+        if board is None:
+            return 1
+        if self.is_exact_rank(elapsed_time, keyword):
+            return 1 + sum(1 for neg_time, _, _ in board["heap"] if -neg_time < elapsed_time)
+        bucket = self._bucket(elapsed_time)
+        faster = sum(count for b, count in board["hist"].items() if int(b) < bucket)
+        # 같은 구간 안의 순서는 알 수 없으므로 절반이 앞에 있다고 추정
+        return 1 + faster + board["hist"].get(str(bucket), 0) // 2
+
+    def is_exact_rank(self, elapsed_time: float, keyword: Optional[str] = None) -> bool:
+        """
+        top-K 안의 기록이면 True (rank()가 정확한 순위)
+        """
+        board = self._boards.get(keyword or GLOBAL_SCOPE)
+        if board is None:
+            return True
+        heap = board["heap"]
+        return len(heap) < self.k or elapsed_time <= -heap[0][0]
+
+    def rank_label(self, elapsed_time: float, keyword: Optional[str] = None) -> str:
+        rank = self.rank(elapsed_time, keyword)
+        if self.is_exact_rank(elapsed_time, keyword):
+            return f"{rank}위"
+        return f"약 {rank}위"
+
+    def count(self, keyword: Optional[str] = None) -> int:
+        board = self._boards.get(keyword or GLOBAL_SCOPE)
+        return board["count"] if board else 0
+
+    # ------------------------------------------------------------------
+    # internal
+    # ------------------------------------------------------------------
+    def _reset(self):
+        self._inode = None
+        self._offset = 0
+        self._boards: Dict[str, dict] = {}
+
+    def _bucket(self, elapsed_time: float) -> int:
+        return min(int(elapsed_time // self.bucket_seconds), self.max_buckets)
+
+    def _add(self, record: dict):
+        # 모든 오류를 찾은 게임만 순위에 포함
+        if not is_ranked(record):
+            return
+        elapsed_time = record["time"]
+        keyword = record.get("keyword") or ""
+        entry = (-elapsed_time, record.get("id") or "", keyword)
+        bucket = str(self._bucket(elapsed_time))
+        for scope in (GLOBAL_SCOPE, keyword):
+            board = self._boards.setdefault(scope, {"heap": [], "count": 0, "hist": {}})
+            board["count"] += 1
+            board["hist"][bucket] = board["hist"].get(bucket, 0) + 1
+            if len(board["heap"]) < self.k:
+                heapq.heappush(board["heap"], entry)
+            elif entry > board["heap"][0]:
+                heapq.heapreplace(board["heap"], entry)
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if index.get("k") != self.k or index.get("bucket_seconds") != self.bucket_seconds:
+            return
+        self._inode = index.get("inode")
+        self._offset = index.get("offset", 0)
+        self._boards = {
+            scope: {
+                "heap": [tuple(entry) for entry in board["heap"]],
+                "count": board["count"],
+                "hist": board["hist"],
+            }
+            for scope, board in index.get("boards", {}).items()
+        }
+        for board in self._boards.values():
+            heapq.heapify(board["heap"])
+
+    def _save(self):
+        index = {
+            "k": self.k,
+            "bucket_seconds": self.bucket_seconds,
+            "inode": self._inode,
+            "offset": self._offset,
+            "boards": self._boards,
+        }
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logging.error(f"[Leaderboard] index save error: {e}")
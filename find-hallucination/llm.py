@@ -1,7 +1,8 @@
 import logging
 import os
+import threading
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from langchain.prompts.chat import (
@@ -9,11 +10,13 @@ from langchain.prompts.chat import (
     SystemMessagePromptTemplate,
     HumanMessagePromptTemplate,
 )
-from langchain_aws import ChatBedrockConverse
 from langchain_core.output_parsers import JsonOutputParser
 from langfuse.callback import CallbackHandler
 from pydantic import BaseModel, Field
 
+from llm_providers import get_provider
+from problem_cache import ProblemCache
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
@@ -125,23 +128,13 @@ class BedrockChatModel(Enum):
 
 
 # ----------------------------------------------------------------------
-# 4) get_chat_model (Stub)
+# 4) get_chat_model (LLM_PROVIDER: bedrock | local)
 # ----------------------------------------------------------------------
+llm_provider = get_provider()
+
+
 def get_chat_model(model: str, temperature: float):
-    if os.getenv("PHASE") == "LOCAL":
-
-        return ChatBedrockConverse(
-            model=model,
-            temperature=temperature,
-            region_name="us-west-2",
-            credentials_profile_name="saml",
-        )
-    else:
-        return ChatBedrockConverse(
-            model=model,
-            temperature=temperature,
-            region_name="us-west-2",
-        )
+    return llm_provider.create_chat_model(model=model, temperature=temperature)
 
 
 # ----------------------------------------------------------------------
@@ -177,7 +170,59 @@ def generate_keywords() -> dict:
 # ----------------------------------------------------------------------
 # 6) 문제 생성 함수
 # ----------------------------------------------------------------------
+PROBLEM_CACHE_ENABLED = os.getenv("PROBLEM_CACHE_ENABLED", "true").lower() == "true"
+
+PROBLEM_TEMPERATURE = 0.3
+
+_problem_cache: Optional[ProblemCache] = None
+_problem_cache_lock = threading.Lock()
+
+
+def get_problem_cache() -> Optional[ProblemCache]:
+    """
+    디스크 캐시는 처음 사용할 때 연다. (import만으로 data/problem_cache.db를 만들지 않도록)
+    """
+    global _problem_cache
+    if not PROBLEM_CACHE_ENABLED:
+        return None
+    with _problem_cache_lock:
+        if _problem_cache is None:
+            _problem_cache = ProblemCache(
+                path=os.getenv("PROBLEM_CACHE_PATH", "data/problem_cache.db"),
+                ttl=float(os.getenv("PROBLEM_CACHE_TTL", "86400")),
+                max_bytes=int(os.getenv("PROBLEM_CACHE_MAX_BYTES", str(50 * 1024 * 1024))),
+                variety=int(os.getenv("PROBLEM_CACHE_VARIETY", "3")),
+            )
+    return _problem_cache
+
+
+def problem_cache_spec() -> dict:
+    return {
+        "prompt_text": Prompts.PROBLEM_PROMPT_SYSTEM.value + "\n" + Prompts.PROBLEM_PROMPT_HUMAN.value,
+        "model": BedrockChatModel.NOVA_PRO.value,
+        "temperature": PROBLEM_TEMPERATURE,
+    }
+
+
 def generate_problem(keyword: str) -> dict:
+    # 캐시에 있으면 LLM 호출 없이 재사용
+    problem_cache = get_problem_cache()
+    if problem_cache is not None:
+        cached = problem_cache.get(keyword, **problem_cache_spec())
+        if cached is not None:
+            logging.info(f"[generate_problem] cache hit: {keyword}")
+            return cached
+
+    state = create_problem(keyword)
+    if problem_cache is not None and state.get("right_text") and state.get("wrong_text"):
+        problem_cache.put(keyword, problem=state, **problem_cache_spec())
+    return state
+
+
+def create_problem(keyword: str) -> dict:
+    """
+    캐시를 거치지 않고 LLM으로 새 문제를 생성한다. (문제 은행 만들기 등 항상 새 문제가 필요할 때)
+    """
     state = {}
     # 1) parser 생성
     parser = JsonOutputParser(pydantic_object=ProblemResponse)
@@ -189,7 +234,7 @@ def generate_problem(keyword: str) -> dict:
     ]).partial(format_instructions=parser.get_format_instructions())
 
     # 3) LLM 준비
-    llm = get_chat_model(model=BedrockChatModel.NOVA_PRO.value, temperature=0.3)
+    llm = get_chat_model(model=BedrockChatModel.NOVA_PRO.value, temperature=PROBLEM_TEMPERATURE)
 
     # 4) chain 실행
     chain = problem_prompt | llm | parser
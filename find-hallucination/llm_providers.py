@@ -0,0 +1,324 @@
+"""
+LLM 공급자(provider) 계층
+
+- bedrock: AWS Bedrock (ChatBedrockConverse). 공급자 하나가 bedrock-runtime 클라이언트 하나를 공유한다.
+- local  : AWS 없이 동작하는 결정적(deterministic) 대체 모델. 스키마에 맞는 keywords / right_text /
+           wrong_text JSON을 만들고, 지연 시간·토큰 속도·실패를 환경 변수로 조절할 수 있다.
+           (LLM 외 구간의 오버헤드 측정, 부하 테스트용)
+
+LLM_PROVIDER 환경 변수로 선택한다. (기본값: bedrock)
+
+공유 모듈: 이 파일은 find-hallucination/llm_providers.py와 항상 같아야 한다.
+백엔드 쪽을 수정한 뒤 find-hallucination/sync_shared.py로 클라이언트에 복사한다.
+"""
+import abc
+import ast
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+class LLMProvider(abc.ABC):
+    name = ""
+
+    @abc.abstractmethod
+    def create_chat_model(self, model: str, temperature: float):
+        """
+        model / temperature로 langchain 채팅 모델을 만든다.
+        """
+
+    def connect(self):
+        """
+        공급자 클라이언트를 미리 만든다. (첫 요청이 클라이언트 생성 비용을 치르지 않도록)
+        """
+
+    def prime(self, models: Iterable[str], connections: int = 1):
+        """
+        모델마다 connections개의 커넥션을 미리 열어 둔다. (TLS 연결, 인증 등)
+        """
+
+
+# ----------------------------------------------------------------------
+# Bedrock
+# ----------------------------------------------------------------------
+class BedrockProvider(LLMProvider):
+    name = "bedrock"
+
+    def __init__(
+        self,
+        region_name: str = "us-west-2",
+        credentials_profile_name: Optional[str] = None,
+        max_pool_connections: int = 16,
+    ):
+        self.region_name = region_name
+        self.credentials_profile_name = credentials_profile_name
+        self.max_pool_connections = max_pool_connections
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """
+        모든 채팅 모델이 공유하는 bedrock-runtime 클라이언트 (HTTP 커넥션 풀 공유)
+        """
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import boto3
+                    from botocore.config import Config
+
+                    session = boto3.Session(profile_name=self.credentials_profile_name)
+                    self._client = session.client(
+                        "bedrock-runtime",
+                        region_name=self.region_name,
+                        config=Config(max_pool_connections=self.max_pool_connections),
+                    )
+        return self._client
+
+    def connect(self):
+        return self.client
+
+    def prime(self, models: Iterable[str], connections: int = 1):
+        # 출력 1토큰짜리 converse 호출을 동시에 보내 커넥션 풀에 연결을 채워 둔다
+        calls = [model for model in models for _ in range(connections)]
+        if not calls:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(calls), self.max_pool_connections)) as executor:
+            list(executor.map(self._ping, calls))
+
+    def _ping(self, model: str):
+        self.client.converse(
+            modelId=model,
+            messages=[{"role": "user", "content": [{"text": "ping"}]}],
+            inferenceConfig={"maxTokens": 1},
+        )
+
+    def create_chat_model(self, model: str, temperature: float):
+        from langchain_aws import ChatBedrockConverse
+
+        return ChatBedrockConverse(
+            model=model,
+            temperature=temperature,
+            region_name=self.region_name,
+            client=self.client,
+        )
+
+
+# ----------------------------------------------------------------------
+# Local stand-in
+# ----------------------------------------------------------------------
+LOCAL_KEYWORDS = [
+    "양자 컴퓨팅", "우주 탐사", "AI 규제", "고대 문명", "기후 변화", "e스포츠", "현대 미술", "심해 생물",
+    "르네상스", "반도체", "올림픽", "클래식 음악", "화산", "인류의 진화", "블록체인", "영화 산업",
+]
+
+
+def local_response(text: str, rng: random.Random, sentences: int) -> str:
+    """
+    프롬프트가 요구하는 스키마(keywords / right_text / wrong_text / right+wrong)에 맞는 JSON 생성
+    """
+    if "내용을 바꿀 문장" in text:
+        match = re.search(r"```\s*(\[.*?\])\s*```", text, re.S)
+        right_text = ast.literal_eval(match.group(1)) if match else [""] * sentences
+        return json.dumps({"wrong_text": [f"(거짓) {s}" for s in right_text]}, ensure_ascii=False)
+    if '"keywords"' in text:
+        match = re.search(r"(\d+)개만", text)
+        count = min(int(match.group(1)) if match else 5, len(LOCAL_KEYWORDS))
+        return json.dumps({"keywords": rng.sample(LOCAL_KEYWORDS, count)}, ensure_ascii=False)
+
+    match = re.search(r"분야는 (.+?) 입니다", text)
+    keyword = match.group(1).strip() if match else "상식"
+    right_text = [f"{keyword}에 대한 {i + 1}번째 사실 문장이다." for i in range(sentences)]
+    payload = {
+        "category": keyword,
+        "subject": f"{keyword}의 세부 주제",
+        "story_idea": f"{keyword}에 대한 글감",
+        "right_text": right_text,
+    }
+    if '"wrong_text"' in text:
+        payload["wrong_text"] = [f"(거짓) {s}" for s in right_text]
+    return json.dumps(payload, ensure_ascii=False)
+
+
+# 프롬프트별 호출 횟수 (n번째 호출마다 결정적으로 다른 응답을 만들기 위함)
+# 오래 실행되는 서버에서 끝없이 늘지 않도록 최근에 쓴 프롬프트 LOCAL_CALLS_MAX개까지만 기억한다 (LRU)
+LOCAL_CALLS_MAX = 10000
+_local_calls: "OrderedDict[str, int]" = OrderedDict()
+_local_calls_lock = threading.Lock()
+
+
+def message_text(message: BaseMessage) -> str:
+    """
+    content block 리스트(cache point 등)로 된 메시지에서 텍스트만 이어 붙인다.
+    """
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in message.content
+    )
+
+
+def split_tokens(content: str, size: int = 4) -> List[str]:
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+class LocalChatModel(BaseChatModel):
+    """
+    결정적 대체 채팅 모델.
+    같은 seed와 같은 프롬프트라면 n번째 호출의 응답은 항상 같다.
+    """
+    latency: float = 0.5            # 첫 토큰까지의 지연(초)
+    jitter: float = 0.0             # 지연 편차(초)
+    tokens_per_sec: float = 0.0     # 0이면 출력 속도 제한 없음
+    failure_rate: float = 0.0       # 예외 발생 확률
+    malformed_rate: float = 0.0     # 잘린 JSON을 돌려줄 확률
+    sentences: int = 15
+    seed: int = 0
+    model_name: str = "local"
+
+    @property
+    def _llm_type(self) -> str:
+        return "local-find-hallucination"
+
+    def _rng(self, text: str) -> random.Random:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with _local_calls_lock:
+            count = _local_calls.pop(digest, 0)
+            _local_calls[digest] = count + 1
+            if len(_local_calls) > LOCAL_CALLS_MAX:
+                _local_calls.popitem(last=False)
+        return random.Random(f"{self.seed}:{digest}:{count}")
+
+    def _plan(self, messages: List[BaseMessage]):
+        text = "\n".join(message_text(m) for m in messages)
+        rng = self._rng(text)
+        delay = max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+        if rng.random() < self.failure_rate:
+            return delay, None, text
+        content = local_response(text, rng, self.sentences)
+        if rng.random() < self.malformed_rate:
+            content = content[: len(content) // 2]
+        return delay, content, text
+
+    def _usage(self, content: str, prompt: str) -> dict:
+        input_tokens = len(prompt) // 4 + 1
+        output_tokens = len(split_tokens(content))
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _message(self, content: str, prompt: str) -> AIMessage:
+        return AIMessage(
+            content=content,
+            usage_metadata=self._usage(content, prompt),
+            response_metadata={"model_name": self.model_name},
+        )
+
+    def _usage_chunk(self, content: str, prompt: str) -> ChatGenerationChunk:
+        # 스트리밍 마지막 chunk에 토큰 사용량을 싣는다 (Bedrock 스트리밍과 같은 방식)
+        return ChatGenerationChunk(message=AIMessageChunk(
+            content="",
+            usage_metadata=self._usage(content, prompt),
+            response_metadata={"model_name": self.model_name},
+        ))
+
+    def _output_time(self, content: str) -> float:
+        if self.tokens_per_sec <= 0:
+            return 0.0
+        return len(split_tokens(content)) / self.tokens_per_sec
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        delay, content, prompt = self._plan(messages)
+        time.sleep(delay)
+        if content is None:
+            raise RuntimeError("local provider: injected failure")
+        time.sleep(self._output_time(content))
+        return ChatResult(generations=[ChatGeneration(message=self._message(content, prompt))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        delay, content, prompt = self._plan(messages)
+        await asyncio.sleep(delay)
+        if content is None:
+            raise RuntimeError("local provider: injected failure")
+        await asyncio.sleep(self._output_time(content))
+        return ChatResult(generations=[ChatGeneration(message=self._message(content, prompt))])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        delay, content, prompt = self._plan(messages)
+        time.sleep(delay)
+        if content is None:
+            raise RuntimeError("local provider: injected failure")
+        step = 1 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+        for token in split_tokens(content):
+            if step:
+                time.sleep(step)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        yield self._usage_chunk(content, prompt)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        delay, content, prompt = self._plan(messages)
+        await asyncio.sleep(delay)
+        if content is None:
+            raise RuntimeError("local provider: injected failure")
+        step = 1 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+        for token in split_tokens(content):
+            if step:
+                await asyncio.sleep(step)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        yield self._usage_chunk(content, prompt)
+
+
+class LocalProvider(LLMProvider):
+    name = "local"
+
+    def __init__(self, **settings):
+        self.settings = settings
+
+    @classmethod
+    def from_env(cls) -> "LocalProvider":
+        return cls(
+            latency=float(os.getenv("LOCAL_LLM_LATENCY", "0.5")),
+            jitter=float(os.getenv("LOCAL_LLM_JITTER", "0")),
+            tokens_per_sec=float(os.getenv("LOCAL_LLM_TOKENS_PER_SEC", "0")),
+            failure_rate=float(os.getenv("LOCAL_LLM_FAILURE_RATE", "0")),
+            malformed_rate=float(os.getenv("LOCAL_LLM_MALFORMED_RATE", "0")),
+            sentences=int(os.getenv("LOCAL_LLM_SENTENCES", "15")),
+            seed=int(os.getenv("LOCAL_LLM_SEED", "0")),
+        )
+
+    def create_chat_model(self, model: str, temperature: float):
+        return LocalChatModel(model_name=model, **self.settings)
+
+
+def get_provider(name: Optional[str] = None) -> LLMProvider:
+    """
+    이름(없으면 LLM_PROVIDER 환경 변수)에 해당하는 공급자 생성
+    """
+    name = (name or os.getenv("LLM_PROVIDER", "bedrock")).lower()
+    if name == "local":
+        return LocalProvider.from_env()
+    if name == "bedrock":
+        return BedrockProvider(
+            credentials_profile_name="saml" if os.getenv("PHASE") == "LOCAL" else None,
+            max_pool_connections=int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "16")),
+        )
+    raise ValueError(f"unknown LLM_PROVIDER: {name}")
@@ -1,11 +1,23 @@
+import importlib
 import logging
+import os
 import pygame
 import sys
-import json
 import time
 import random
+import threading
+from concurrent.futures import Future
 
-from llm import generate_keywords, generate_problem
+from dotenv import load_dotenv
+
+from leaderboard import Leaderboard
+from problem_bank import PROBLEM_BANK_PATH, ProblemBank
+from scores import ScoreLog
+from text_layout import get_layout
+
+load_dotenv()
+
+logging.basicConfig(level=logging.INFO)
 
 # 화면 크기
 SCREEN_WIDTH = 720
@@ -18,6 +30,9 @@ STATE_GAME = 1
 STATE_RESULT = 2
 STATE_LOADING = 3  # LLM 호출 로딩 화면
 
+# 메인 메뉴에 보여줄 키워드 수
+KEYWORDS_PER_MENU = 5
+
 # 색상
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -27,6 +42,7 @@ PINK = (255, 200, 200)  # 선택된 블록 배경
 
 # 폰트 경로 (임의)
 FONT_PATH = "assets/Pretendard-Regular.otf"
+BGM_PATH = "assets/bgm.mp3"
 
 # 상단/하단 레이아웃 높이
 TOP_HEIGHT = 100
@@ -45,21 +61,31 @@ class WordBlock:
         self.rect = rect
         self.index = index
         self.selected = False
+        self.line_surfaces = None  # 줄별 렌더링 결과 캐시 (선택 토글 시에도 재사용)
+
+    def render_lines(self, font):
+        if self.line_surfaces is None:
+            self.line_surfaces = [font.render(line, True, BLACK) for line in self.lines]
+        return self.line_surfaces
+
+    def screen_rect(self, offset=0):
+        draw_rect = self.rect.copy()
+        draw_rect.y -= offset  # 스크롤 반영
+        return draw_rect
 
     def draw(self, screen, font, offset=0):
         """
         offset(스크롤 위치)만큼 y 좌표를 위/아래로 이동하여 그린다.
+        텍스트는 캐시된 surface를 사용하고, 선택 여부에 따라 배경색만 바뀐다.
         """
-        draw_rect = self.rect.copy()
-        draw_rect.y -= offset  # 스크롤 반영
+        draw_rect = self.screen_rect(offset)
 
         if self.selected:
             pygame.draw.rect(screen, PINK, draw_rect)
 
         line_height = font.get_linesize()
         x, y = draw_rect.x, draw_rect.y
-        for line in self.lines:
-            surf = font.render(line, True, BLACK)
+        for surf in self.render_lines(font):
             screen.blit(surf, (x, y))
             y += line_height
 
@@ -72,27 +98,32 @@ class WordBlock:
         return shifted_rect.collidepoint(pos)
 
 
-def wrap_text(sentence, font, max_width):
+class TextCache:
     """
-    하나의 문장을 max_width에 맞춰 단어 단위로 줄바꿈 -> lines 리스트 반환
+    (text, color)별로 렌더링한 surface를 재사용 (버튼/제목 등 고정 텍스트용)
     """
-    words = sentence.split()
-    lines = []
-    current_line = []
-
-    for word in words:
-        test_line = " ".join(current_line + [word])
-        w, _ = font.size(test_line)
-        if w <= max_width:
-            current_line.append(word)
-        else:
-            lines.append(" ".join(current_line))
-            current_line = [word]
+    def __init__(self, font, max_size=256):
+        self.font = font
+        self.max_size = max_size
+        self._cache = {}
+
+    def render(self, text, color=BLACK):
+        key = (text, color)
+        surf = self._cache.get(key)
+        if surf is None:
+            if len(self._cache) >= self.max_size:
+                self._cache.clear()
+            surf = self.font.render(text, True, color)
+            self._cache[key] = surf
+        return surf
 
-    if current_line:
-        lines.append(" ".join(current_line))
 
-    return lines
+def wrap_text(sentence, font, max_width):
+    """
+    하나의 문장을 max_width에 맞춰 줄바꿈 -> lines 리스트 반환
+    (공백 기준, 한글 단어는 음절 단위로도 나눔. 결과는 폰트별로 캐시됨)
+    """
+    return get_layout(font).wrap(sentence, max_width)
 
 
 def create_word_blocks(sentences, font, content_rect):
@@ -131,30 +162,150 @@ def get_total_content_height(blocks):
     return last_block.rect.bottom
 
 
-def load_scores():
-    try:
-        with open("data/scores.json", "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+def run_in_background(func, *args):
+    """
+    func(*args)를 데몬 스레드에서 실행하고 Future를 반환한다.
+    (창을 닫을 때 진행 중인 LLM 호출을 기다리지 않도록 데몬 스레드 사용)
+    """
+    future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+class LazyLLM:
+    """
+    llm 모듈(langchain, boto3, langfuse 등)을 백그라운드 스레드에서 import 한다.
+
+    - 창과 첫 프레임을 띄운 뒤 start()로 import를 시작한다.
+    - generate_*()는 import가 끝날 때까지 기다리므로 백그라운드 스레드(run_in_background)에서만 호출한다.
+    """
+
+    def __init__(self, module_name: str = "llm"):
+        self.module_name = module_name
+        self._future = None
+        self._lock = threading.Lock()
+
+    def start(self) -> Future:
+        with self._lock:
+            if self._future is None:
+                self._future = run_in_background(self._load)
+            return self._future
+
+    def _load(self):
+        start = time.perf_counter()
+        module = importlib.import_module(self.module_name)
+        logging.info(f"[LazyLLM] {self.module_name} loaded in {time.perf_counter() - start:.2f}s")
+        return module
 
+    def generate_keywords(self) -> dict:
+        return self.start().result().generate_keywords()
 
-def save_scores(scores):
-    with open("data/scores.json", "w", encoding="utf-8") as f:
-        json.dump(scores, f, ensure_ascii=False, indent=2)
+    def generate_problem(self, keyword: str) -> dict:
+        return self.start().result().generate_problem(keyword)
+
+
+class Bgm:
+    """
+    배경음악. mixer 초기화와 파일 로딩은 첫 프레임 이후 백그라운드에서 하고,
+    준비되기 전의 play()/stop()은 무시한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._ready = threading.Event()
+        self._started = False
+
+    def start(self):
+        if not self._started:
+            self._started = True
+            run_in_background(self._load)
+
+    def _load(self):
+        try:
+            pygame.mixer.init()
+            pygame.mixer.music.load(self.path)
+            self._ready.set()
+        except pygame.error as e:
+            logging.error(f"BGM load error: {e}")
+
+    def play(self):
+        if self._ready.is_set() and not pygame.mixer.music.get_busy():
+            pygame.mixer.music.play(-1)
+
+    def stop(self):
+        if self._ready.is_set():
+            pygame.mixer.music.stop()
+
+
+llm = LazyLLM()
+
+
+def draw_loading_screen(screen, font):
+    screen.fill(WHITE)
+    dots = "." * (int(time.time() * 3) % 4)
+    loading_surf = font.render(f"Loading{dots}", True, BLACK)
+    screen.blit(
+        loading_surf,
+        (SCREEN_WIDTH // 2 - loading_surf.get_width() // 2,
+         SCREEN_HEIGHT // 2)
+    )
+    pygame.display.update()
+
+
+def completed_future(result):
+    """
+    이미 결과가 있는 Future (문제 은행처럼 바로 얻은 결과를 로딩 흐름에 그대로 태우기 위함)
+    """
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def load_problem(problem_bank, keyword):
+    """
+    문제 은행에 keyword의 문제가 있으면 바로, 없을 때만 LLM으로 생성한다.
+    """
+    problem = problem_bank.pick(keyword)
+    if problem is not None:
+        logging.info(f"[problem_bank] hit: {keyword}")
+        return completed_future(problem)
+    return run_in_background(llm.generate_problem, keyword)
 
 
 def main():
-    pygame.init()
+    # mixer(오디오 장치)는 BGM과 함께 나중에 초기화하므로 pygame.init() 대신 필요한 모듈만 초기화
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("틀린 글 찾기 챌린지")
     clock = pygame.time.Clock()
 
     base_font = pygame.font.Font(FONT_PATH, 30)
+    text_cache = TextCache(base_font)
+
+    # 첫 프레임을 먼저 보여준 뒤 무거운 초기화(LLM 모듈 import, BGM)를 백그라운드로 시작
+    draw_loading_screen(screen, base_font)
+    llm.start()
+    bgm = Bgm(BGM_PATH)
+    bgm.start()
+
+    # 게임 기록 (기존 scores.json이 있으면 중복 제거 후 한 번만 옮긴다)
+    score_log = ScoreLog()
+    score_log.migrate_legacy()
+    leaderboard = Leaderboard(score_log)
+    leaderboard.refresh()
 
-    # BGM
-    pygame.mixer.init()
-    pygame.mixer.music.load("assets/bgm.mp3")
+    # 오프라인 문제 은행 (처음 사용할 때 연다. 파일이 없으면 LLM만 사용)
+    problem_bank = ProblemBank(os.getenv("PROBLEM_BANK_PATH", PROBLEM_BANK_PATH))
 
     # 레이아웃 사각형
     top_rect = pygame.Rect(0, 0, SCREEN_WIDTH, TOP_HEIGHT)
@@ -165,6 +316,9 @@ def main():
         SCREEN_WIDTH,
         SCREEN_HEIGHT - TOP_HEIGHT - BOTTOM_HEIGHT
     )
+    timer_rect = pygame.Rect(10, 20, SCREEN_WIDTH - 150, TOP_HEIGHT - 40)
+    # 부분 갱신 시 content 테두리를 덮지 않도록 안쪽 영역만 사용
+    content_inner_rect = content_rect.inflate(-4, -4)
 
     # 상태
     game_state = STATE_LOADING
@@ -180,14 +334,29 @@ def main():
     game_start_time = 0
     game_end_time = 0
     correct_count = 0
+    rank_text = ""
 
     # LLM 결과
     keywords = []
     data = None
 
+    # 백그라운드 LLM 작업
+    loading_future = None
+    prefetched = {}  # keyword -> Future (메뉴에 표시된 키워드의 문제를 미리 생성)
+
+    # 게임 화면 부분 갱신(dirty rect)용 상태
+    drawn_state = None
+    full_redraw = True
+    dirty_blocks = []
+    timer_text = None
+
     while True:
         clock.tick(FPS)
 
+        # 상태가 바뀐 첫 프레임인지 확인
+        entered_state = game_state != drawn_state
+        drawn_state = game_state
+
         # ──────────────────────────────────────────
         # 로딩 상태
         # ──────────────────────────────────────────
@@ -197,26 +366,36 @@ def main():
                     pygame.quit()
                     sys.exit()
 
+            # LLM 작업은 백그라운드 스레드에서 실행 (이벤트 루프는 계속 동작)
+            if loading_future is None:
+                if load_type == "keywords":
+                    # 문제 은행이 있으면 그 키워드로 바로 시작 (LLM 왕복 없음)
+                    bank_keywords = problem_bank.random_keywords(KEYWORDS_PER_MENU)
+                    if bank_keywords:
+                        loading_future = completed_future({"keywords": bank_keywords})
+                    else:
+                        loading_future = run_in_background(llm.generate_keywords)
+                elif load_type == "problem":
+                    loading_future = prefetched.pop(selected_keyword, None)
+                    if loading_future is None:
+                        loading_future = load_problem(problem_bank, selected_keyword)
+
             # 로딩 화면 표시
-            screen.fill(WHITE)
-            loading_surf = base_font.render("Loading...", True, BLACK)
-            screen.blit(
-                loading_surf,
-                (SCREEN_WIDTH // 2 - loading_surf.get_width() // 2,
-                 SCREEN_HEIGHT // 2)
-            )
-            pygame.display.update()
+            draw_loading_screen(screen, base_font)
+
+            if not loading_future.done():
+                continue
 
             try:
                 if load_type == "keywords":
                     # 키워드 로딩
-                    kw_data = generate_keywords()  # LLM 호출
+                    kw_data = loading_future.result()
                     keywords = kw_data.get("keywords", [])
                     game_state = STATE_MAIN_MENU
 
                 elif load_type == "problem":
                     # 문제 생성 로딩
-                    data = generate_problem(selected_keyword)
+                    data = loading_future.result()
                     wrong_text = data.get("wrong_text", [])
                     right_text = data.get("right_text", [])
                     # 5개 틀린 문장 인덱스
@@ -243,12 +422,19 @@ def main():
                 logging.error(f"Loading error: {e}")
                 # 에러 시 임시로 메인 메뉴
                 game_state = STATE_MAIN_MENU
+            finally:
+                loading_future = None
 
         # ──────────────────────────────────────────
         # 메인 메뉴
         # ──────────────────────────────────────────
         elif game_state == STATE_MAIN_MENU:
-            pygame.mixer.music.stop()
+            bgm.stop()
+
+            # 메뉴에 표시된 키워드의 문제를 미리 생성 (클릭 시 바로 시작)
+            for kw in keywords:
+                if kw not in prefetched:
+                    prefetched[kw] = load_problem(problem_bank, kw)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -271,7 +457,7 @@ def main():
             # 메뉴 화면 그리기
             screen.fill(WHITE)
 
-            title_surf = base_font.render("틀린 글 찾기 챌린지", True, BLACK)
+            title_surf = text_cache.render("틀린 글 찾기 챌린지")
             screen.blit(title_surf, (SCREEN_WIDTH // 2 - 150, 100))
 
             btn_y = 250
@@ -279,7 +465,7 @@ def main():
                 rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, btn_y, 300, 60)
                 pygame.draw.rect(screen, LIGHT_GRAY, rect)
                 pygame.draw.rect(screen, BLACK, rect, 2)
-                kw_surf = base_font.render(kw, True, BLACK)
+                kw_surf = text_cache.render(kw)
                 screen.blit(kw_surf, (rect.x + 20, rect.y + 10))
                 btn_y += 80
 
@@ -289,8 +475,10 @@ def main():
         # 게임 화면
         # ──────────────────────────────────────────
         elif game_state == STATE_GAME:
-            if not pygame.mixer.music.get_busy():
-                pygame.mixer.music.play(-1)
+            bgm.play()
+
+            if entered_state:
+                full_redraw = True
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -302,11 +490,14 @@ def main():
                     mouse_x, mouse_y = pygame.mouse.get_pos()
                     if content_rect.collidepoint(mouse_x, mouse_y):
                         # event.y: 위로 양수, 아래로 음수
+                        prev_offset = scroll_offset
                         scroll_offset -= event.y * 30
                         if scroll_offset < 0:
                             scroll_offset = 0
                         if scroll_offset > max_scroll:
                             scroll_offset = max_scroll
+                        if scroll_offset != prev_offset:
+                            full_redraw = True
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     # 왼쪽 버튼 클릭만 문장 선택/버튼 동작
@@ -323,6 +514,7 @@ def main():
                                     if selected_count > 5:
                                         # 가장 최근 클릭을 해제
                                         wb.selected = False
+                                    dirty_blocks.append(wb)
                                     break
 
                         # 상단의 "처음으로" 버튼
@@ -331,7 +523,7 @@ def main():
                             100, 40
                         )
                         if home_btn_rect.collidepoint(mouse_pos):
-                            pygame.mixer.music.stop()
+                            bgm.stop()
                             game_state = STATE_MAIN_MENU
 
                         # 하단의 "정답 제출" 버튼
@@ -350,55 +542,100 @@ def main():
                             game_end_time = time.time()
                             game_state = STATE_RESULT
 
-            # ────────────── 화면 그리기 ──────────────
-            screen.fill(WHITE)
-
-            # 1) 상단 영역 (타이머, "처음으로" 버튼)
-            pygame.draw.rect(screen, LIGHT_GRAY, top_rect)
-            pygame.draw.rect(screen, BLACK, top_rect, 2)
+                            # 모든 오류를 찾은 게임만 한 번 기록
+                            if correct_count == total_errors:
+                                final_time = game_end_time - game_start_time
+                                score_log.append(
+                                    keyword=selected_keyword,
+                                    elapsed_time=final_time,
+                                    correct_count=correct_count,
+                                    total_errors=total_errors,
+                                )
+                                leaderboard.refresh()
+                                rank_text = (
+                                    f"전체 {leaderboard.rank_label(final_time)} / "
+                                    f"{selected_keyword} {leaderboard.rank_label(final_time, selected_keyword)}"
+                                )
 
+            # ────────────── 화면 그리기 ──────────────
             elapsed_time = time.time() - game_start_time
-            timer_surf = base_font.render(f"Time {elapsed_time:.1f}s", True, BLACK)
-            screen.blit(timer_surf, (20, 30))
-
-            home_btn_rect = pygame.Rect(SCREEN_WIDTH - 120, 20, 100, 40)
-            pygame.draw.rect(screen, WHITE, home_btn_rect)
-            pygame.draw.rect(screen, BLACK, home_btn_rect, 2)
-            home_text = base_font.render("뒤로", True, BLACK)
-            screen.blit(home_text, (home_btn_rect.x + 5, home_btn_rect.y + 5))
-
-            # 2) content 영역 (문제/문장 블록)
-            # 배경
-            pygame.draw.rect(screen, WHITE, content_rect)
-            # 경계선 표시
-            pygame.draw.rect(screen, BLACK, content_rect, 2)
-
-            # clip 설정 (content 영역 밖은 그리지 않음)
-            prev_clip = screen.get_clip()
-            screen.set_clip(content_rect)
-
-            # 문장 블록 그리기
-            for wb in word_blocks:
-                wb.draw(screen, base_font, offset=scroll_offset)
-
-            # clip 해제
-            screen.set_clip(prev_clip)
-
-            # 3) 하단 영역 (정답 제출 버튼)
-            pygame.draw.rect(screen, LIGHT_GRAY, bottom_rect)
-            pygame.draw.rect(screen, BLACK, bottom_rect, 2)
-
-            submit_rect = pygame.Rect(
-                SCREEN_WIDTH // 2 - 150,
-                SCREEN_HEIGHT - BOTTOM_HEIGHT + 20,
-                300, 80
-            )
-            pygame.draw.rect(screen, WHITE, submit_rect)
-            pygame.draw.rect(screen, BLACK, submit_rect, 2)
-            submit_text = base_font.render("정답 제출", True, BLACK)
-            screen.blit(submit_text, (submit_rect.x + 60, submit_rect.y + 20))
-
-            pygame.display.update()
+            new_timer_text = f"Time {elapsed_time:.1f}s"
+
+            if full_redraw:
+                screen.fill(WHITE)
+
+                # 1) 상단 영역 (타이머, "처음으로" 버튼)
+                pygame.draw.rect(screen, LIGHT_GRAY, top_rect)
+                pygame.draw.rect(screen, BLACK, top_rect, 2)
+
+                screen.blit(base_font.render(new_timer_text, True, BLACK), (20, 30))
+                timer_text = new_timer_text
+
+                home_btn_rect = pygame.Rect(SCREEN_WIDTH - 120, 20, 100, 40)
+                pygame.draw.rect(screen, WHITE, home_btn_rect)
+                pygame.draw.rect(screen, BLACK, home_btn_rect, 2)
+                home_text = text_cache.render("뒤로")
+                screen.blit(home_text, (home_btn_rect.x + 5, home_btn_rect.y + 5))
+
+                # 2) content 영역 (문제/문장 블록)
+                # 배경
+                pygame.draw.rect(screen, WHITE, content_rect)
+                # 경계선 표시
+                pygame.draw.rect(screen, BLACK, content_rect, 2)
+
+                # clip 설정 (content 영역 밖은 그리지 않음)
+                prev_clip = screen.get_clip()
+                screen.set_clip(content_rect)
+
+                # 문장 블록 그리기 (화면에 보이는 블록만)
+                for wb in word_blocks:
+                    if wb.screen_rect(scroll_offset).colliderect(content_rect):
+                        wb.draw(screen, base_font, offset=scroll_offset)
+
+                # clip 해제
+                screen.set_clip(prev_clip)
+
+                # 3) 하단 영역 (정답 제출 버튼)
+                pygame.draw.rect(screen, LIGHT_GRAY, bottom_rect)
+                pygame.draw.rect(screen, BLACK, bottom_rect, 2)
+
+                submit_rect = pygame.Rect(
+                    SCREEN_WIDTH // 2 - 150,
+                    SCREEN_HEIGHT - BOTTOM_HEIGHT + 20,
+                    300, 80
+                )
+                pygame.draw.rect(screen, WHITE, submit_rect)
+                pygame.draw.rect(screen, BLACK, submit_rect, 2)
+                submit_text = text_cache.render("정답 제출")
+                screen.blit(submit_text, (submit_rect.x + 60, submit_rect.y + 20))
+
+                pygame.display.update()
+                full_redraw = False
+                dirty_blocks.clear()
+            else:
+                # 바뀐 영역(타이머, 선택이 토글된 블록)만 다시 그린다
+                dirty_rects = []
+
+                if new_timer_text != timer_text:
+                    pygame.draw.rect(screen, LIGHT_GRAY, timer_rect)
+                    screen.blit(base_font.render(new_timer_text, True, BLACK), (20, 30))
+                    timer_text = new_timer_text
+                    dirty_rects.append(timer_rect)
+
+                if dirty_blocks:
+                    prev_clip = screen.get_clip()
+                    screen.set_clip(content_inner_rect)
+                    for wb in dirty_blocks:
+                        block_rect = wb.screen_rect(scroll_offset).clip(content_inner_rect)
+                        if block_rect.width and block_rect.height:
+                            pygame.draw.rect(screen, WHITE, block_rect)
+                            wb.draw(screen, base_font, offset=scroll_offset)
+                            dirty_rects.append(block_rect)
+                    screen.set_clip(prev_clip)
+                    dirty_blocks.clear()
+
+                if dirty_rects:
+                    pygame.display.update(dirty_rects)
 
         # ──────────────────────────────────────────
         # 결과 화면
@@ -425,49 +662,31 @@ def main():
 
             screen.fill(WHITE)
 
-            result_surf1 = base_font.render(
-                f"오류 {total_errors}개 중 {correct_count}개 맞춤!",
-                True,
-                BLACK
-            )
+            result_surf1 = text_cache.render(f"오류 {total_errors}개 중 {correct_count}개 맞춤!")
             screen.blit(result_surf1, (SCREEN_WIDTH // 2 - 150, 300))
 
             if correct_count == total_errors:
                 final_time = game_end_time - game_start_time
-                result_surf2 = base_font.render(
-                    f"축하합니다! 소요 시간: {final_time:.1f}초",
-                    True,
-                    BLACK
-                )
+                result_surf2 = text_cache.render(f"축하합니다! 소요 시간: {final_time:.1f}초")
                 screen.blit(result_surf2, (SCREEN_WIDTH // 2 - 200, 400))
 
-                scores = load_scores()
-                scores.append({
-                    "keyword": selected_keyword,
-                    "time": final_time,
-                    "correct_count": correct_count,
-                    "total_errors": total_errors
-                })
-                save_scores(scores)
+                rank_surf = text_cache.render(rank_text)
+                screen.blit(rank_surf, (SCREEN_WIDTH // 2 - rank_surf.get_width() // 2, 460))
             else:
-                result_surf2 = base_font.render(
-                    "아직 더 찾을 오류가 있습니다!",
-                    True,
-                    RED
-                )
+                result_surf2 = text_cache.render("아직 더 찾을 오류가 있습니다!", RED)
                 screen.blit(result_surf2, (SCREEN_WIDTH // 2 - 170, 400))
 
             if correct_count < total_errors:
                 retry_btn_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 550, 300, 80)
                 pygame.draw.rect(screen, LIGHT_GRAY, retry_btn_rect)
                 pygame.draw.rect(screen, BLACK, retry_btn_rect, 3)
-                retry_text = base_font.render("다시 시도", True, BLACK)
+                retry_text = text_cache.render("다시 시도")
                 screen.blit(retry_text, (retry_btn_rect.x + 60, retry_btn_rect.y + 20))
 
             home_btn_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 700, 300, 80)
             pygame.draw.rect(screen, LIGHT_GRAY, home_btn_rect)
             pygame.draw.rect(screen, BLACK, home_btn_rect, 3)
-            home_text = base_font.render("처음으로", True, BLACK)
+            home_text = text_cache.render("처음으로")
             screen.blit(home_text, (home_btn_rect.x + 60, home_btn_rect.y + 20))
 
             pygame.display.update()
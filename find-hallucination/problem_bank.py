@@ -0,0 +1,291 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import List, Optional
+
+from problem_cache import normalize_keyword
+
+PROBLEM_BANK_PATH = "data/problem_bank.db"
+PROBLEM_BANK_FORMAT = "2"
+
+# 게임 한 판에서 틀린 문장으로 바꾸는 문장 수 (main.py의 random.sample(..., 5))
+MIN_SENTENCES = 5
+
+
+def is_playable(problem: dict) -> bool:
+    right_text = problem.get("right_text") or []
+    wrong_text = problem.get("wrong_text") or []
+    return len(right_text) >= MIN_SENTENCES and len(right_text) == len(wrong_text)
+
+
+def payload_hash(problem: dict) -> str:
+    """
+    같은 문제를 두 번 넣지 않기 위한 내용 해시 (키 순서와 무관)
+    """
+    canonical = json.dumps(problem, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ProblemBank:
+    """
+    미리 생성해 둔 문제를 모아 둔 오프라인 문제 은행 (SQLite 파일 하나)
+
+    - keywords: 키워드마다 연속된 id와 문제 개수를 가진 색인
+    - problems: (키워드 id, 0부터 시작하는 순번) -> zlib으로 압축한 문제 JSON
+    - pick(): 문제 개수를 읽고 임의의 순번 하나를 기본 키로 바로 찾으므로, 은행 크기와 상관없이
+      문제 한 개만 읽는다. (전체를 메모리에 올리지 않음)
+    - 파일은 처음 사용할 때 읽기 전용으로 연다. 파일이 없으면 빈 은행처럼 동작한다.
+    - 키워드 비교는 problem_cache와 같은 normalize_keyword 기준
+    - 문제 내용 해시(payload_hash)가 UNIQUE이므로 같은 문제를 다시 넣어도(재import 등) 중복되지 않는다
+    """
+
+    def __init__(self, path: str = PROBLEM_BANK_PATH, writable: bool = False):
+        self.path = path
+        self.writable = writable
+        self._conn: Optional[sqlite3.Connection] = None
+        self._opened = False
+
+    # ------------------------------------------------------------------
+    # 연결
+    # ------------------------------------------------------------------
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._opened:
+            return self._conn
+        self._opened = True
+
+        if self.writable:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            self._create_schema(conn)
+        elif os.path.exists(self.path):
+            uri = Path(self.path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            return None
+
+        try:
+            version = conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+        except sqlite3.DatabaseError:
+            version = None
+        if version is None or version[0] != PROBLEM_BANK_FORMAT:
+            logging.warning(f"[ProblemBank] unsupported format: {self.path}")
+            conn.close()
+            return None
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS keywords (
+                id INTEGER PRIMARY KEY,
+                keyword_key TEXT NOT NULL UNIQUE,
+                keyword TEXT NOT NULL,
+                problem_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS problems (
+                keyword_id INTEGER NOT NULL,
+                ordinal INTEGER NOT NULL,
+                payload_hash TEXT NOT NULL UNIQUE,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (keyword_id, ordinal)
+            ) WITHOUT ROWID;
+        ''')
+        conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('format', ?)",
+            (PROBLEM_BANK_FORMAT,),
+        )
+        conn.commit()
+
+    @property
+    def available(self) -> bool:
+        return self._connect() is not None
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    def pick(self, keyword: str) -> Optional[dict]:
+        """
+        keyword의 문제 중 하나를 임의로 골라 돌려준다. 없으면 None.
+        """
+        conn = self._connect()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT id, problem_count FROM keywords WHERE keyword_key = ?",
+            (normalize_keyword(keyword),),
+        ).fetchone()
+        if row is None or row[1] == 0:
+            return None
+        keyword_id, problem_count = row
+        payload = conn.execute(
+            "SELECT payload FROM problems WHERE keyword_id = ? AND ordinal = ?",
+            (keyword_id, random.randrange(problem_count)),
+        ).fetchone()
+        if payload is None:
+            return None
+        return json.loads(zlib.decompress(payload[0]))
+
+    def random_keywords(self, count: int) -> List[str]:
+        """
+        문제가 있는 키워드 중 서로 다른 count개를 임의로 고른다. (id가 연속이므로 id를 뽑아 찾는다)
+        """
+        conn = self._connect()
+        if conn is None:
+            return []
+        total = conn.execute("SELECT COALESCE(MAX(id), 0) FROM keywords").fetchone()[0]
+        ids = random.sample(range(1, total + 1), min(count, total))
+        keywords = []
+        for keyword_id in ids:
+            row = conn.execute(
+                "SELECT keyword FROM keywords WHERE id = ? AND problem_count > 0",
+                (keyword_id,),
+            ).fetchone()
+            if row is not None:
+                keywords.append(row[0])
+        return keywords
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        if conn is None:
+            return {"path": self.path, "available": False}
+        keywords, problems = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(problem_count), 0) FROM keywords"
+        ).fetchone()
+        return {
+            "path": self.path,
+            "available": True,
+            "keywords": keywords,
+            "problems": problems,
+            "bytes": os.path.getsize(self.path),
+        }
+
+    # ------------------------------------------------------------------
+    # 쓰기 (문제 은행을 만들 때만 사용)
+    # ------------------------------------------------------------------
+    def add(self, keyword: str, problem: dict) -> bool:
+        """
+        문제 하나를 keyword의 다음 순번으로 추가한다. 플레이할 수 없거나 이미 있는 문제는 건너뛰고 False.
+        """
+        if not self.writable:
+            raise RuntimeError("ProblemBank is read-only")
+        if not is_playable(problem):
+            return False
+        conn = self._connect()
+        keyword = " ".join(keyword.split())
+        key = normalize_keyword(keyword)
+        conn.execute("INSERT OR IGNORE INTO keywords (keyword_key, keyword) VALUES (?, ?)", (key, keyword))
+        keyword_id, problem_count = conn.execute(
+            "SELECT id, problem_count FROM keywords WHERE keyword_key = ?", (key,)
+        ).fetchone()
+        payload = zlib.compress(json.dumps(problem, ensure_ascii=False).encode("utf-8"), 9)
+        inserted = conn.execute(
+            "INSERT OR IGNORE INTO problems (keyword_id, ordinal, payload_hash, payload) VALUES (?, ?, ?, ?)",
+            (keyword_id, problem_count, payload_hash(problem), payload),
+        ).rowcount
+        if inserted:
+            conn.execute("UPDATE keywords SET problem_count = problem_count + 1 WHERE id = ?", (keyword_id,))
+        conn.commit()
+        return bool(inserted)
+
+    def import_cache(self, cache_path: str) -> int:
+        """
+        problem_cache.db에 쌓인 문제들을 문제 은행으로 옮긴다. 추가된 문제 수를 돌려준다.
+        이미 은행에 있는 문제는 건너뛰므로 여러 번 실행해도 결과가 같다.
+        """
+        source = sqlite3.connect(Path(cache_path).resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            # keyword 열은 정규화(소문자)된 값이므로 화면 표시용 display_keyword를 우선 사용한다
+            columns = {row[1] for row in source.execute("PRAGMA table_info(problem_cache)")}
+            keyword_column = "COALESCE(display_keyword, keyword)" if "display_keyword" in columns else "keyword"
+            rows = source.execute(f"SELECT {keyword_column}, payload FROM problem_cache ORDER BY id").fetchall()
+        finally:
+            source.close()
+        return sum(self.add(keyword, json.loads(payload)) for keyword, payload in rows)
+
+    def vacuum(self):
+        conn = self._connect()
+        if conn is not None:
+            conn.execute("VACUUM")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._opened = False
+
+
+# ----------------------------------------------------------------------
+# 문제 은행 만들기
+#   python problem_bank.py build --keywords "우주 탐사" "AI 규제" --per-keyword 5
+#   python problem_bank.py build --random-keywords 20 --per-keyword 3
+#   python problem_bank.py import data/problem_cache.db
+#   python problem_bank.py stats
+# ----------------------------------------------------------------------
+def build(bank: ProblemBank, keywords: List[str], random_keywords: int, per_keyword: int):
+    # 캐시(problem_cache)를 거치면 같은 문제가 여러 번 나오므로 항상 새로 생성한다
+    from llm import create_problem, generate_keywords
+
+    keywords = list(keywords)
+    while len(keywords) < random_keywords:
+        generated = generate_keywords().get("keywords", [])
+        new = [kw for kw in generated if kw not in keywords]
+        if not new:
+            break
+        keywords.extend(new[:random_keywords - len(keywords)])
+
+    for keyword in keywords:
+        added = 0
+        for _ in range(per_keyword):
+            if bank.add(keyword, create_problem(keyword)):
+                added += 1
+        logging.info(f"[ProblemBank] {keyword}: {added}/{per_keyword}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 문제 은행 만들기")
+    parser.add_argument("--path", default=os.getenv("PROBLEM_BANK_PATH", PROBLEM_BANK_PATH))
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="LLM으로 문제를 생성해 추가")
+    build_parser.add_argument("--keywords", nargs="*", default=[])
+    build_parser.add_argument("--random-keywords", type=int, default=0,
+                              help="LLM이 추천한 키워드로 이 개수까지 채운다")
+    build_parser.add_argument("--per-keyword", type=int, default=3)
+
+    import_parser = commands.add_parser("import", help="problem_cache.db의 문제를 추가")
+    import_parser.add_argument("cache_path")
+
+    commands.add_parser("stats", help="문제 은행 통계 출력")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "stats":
+        print(json.dumps(ProblemBank(args.path).stats(), ensure_ascii=False, indent=2))
+        return
+
+    bank = ProblemBank(args.path, writable=True)
+    if args.command == "build":
+        build(bank, args.keywords, args.random_keywords, args.per_keyword)
+    elif args.command == "import":
+        logging.info(f"[ProblemBank] imported: {bank.import_cache(args.cache_path)}")
+    bank.vacuum()
+    print(json.dumps(bank.stats(), ensure_ascii=False, indent=2))
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()
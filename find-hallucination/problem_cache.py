@@ -0,0 +1,160 @@
+# 공유 모듈: 이 파일은 find-hallucination/problem_cache.py와 항상 같아야 한다.
+# 백엔드 쪽을 수정한 뒤 find-hallucination/sync_shared.py로 클라이언트에 복사한다.
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.split()).casefold()
+
+
+def make_cache_key(keyword: str, prompt_text: str, model: str, temperature: float) -> str:
+    """
+    (정규화된 키워드, 프롬프트 해시, 모델 ID, temperature)로 만든 content-addressed 키
+    """
+    prompt_hash = hashlib.sha256(prompt_text.encode("utf-8")).hexdigest()
+    raw = json.dumps([normalize_keyword(keyword), prompt_hash, model, float(temperature)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ProblemCache:
+    """
+    생성된 문제를 SQLite에 저장해 두고 재사용하는 디스크 캐시.
+
+    - ttl: 생성 후 ttl초가 지난 문제는 사용하지 않는다. 삭제는 put()에서 한 번에 한다. (조회마다 쓰기 lock을 잡지 않도록)
+    - max_bytes: 저장된 문제 JSON 크기의 합이 넘으면 가장 오래 사용되지 않은 문제부터 삭제(LRU)
+    - variety: 한 문제를 최대 몇 번까지 내보낸 뒤 삭제할지 (삭제되면 다음 요청에서 새로 생성)
+    - keyword에는 비교용으로 정규화한 키워드를, display_keyword에는 요청받은 그대로의(공백만 정리한) 키워드를 저장
+    """
+
+    def __init__(self, path: str, ttl: float = 86400, max_bytes: int = 50 * 1024 * 1024, variety: int = 3):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.variety = max(1, variety)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+
+    def open(self):
+        """
+        DB 파일을 열고 테이블을 만든다. 호출하지 않아도 처음 사용할 때 자동으로 연다.
+        """
+        with self._lock:
+            self._open_locked()
+
+    def _open_locked(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS problem_cache (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                cache_key TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                display_keyword TEXT,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                serve_count INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+        ''')
+        # 이전 버전의 DB에는 화면 표시용 키워드 열이 없다
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(problem_cache)")}
+        if "display_keyword" not in columns:
+            conn.execute("ALTER TABLE problem_cache ADD COLUMN display_keyword TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_problem_cache_key ON problem_cache (cache_key)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_problem_cache_last_used ON problem_cache (last_used_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_problem_cache_created ON problem_cache (created_at)")
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def get(self, keyword: str, prompt_text: str, model: str, temperature: float) -> Optional[dict]:
+        cache_key = make_cache_key(keyword, prompt_text, model, temperature)
+        now = time.time()
+        with self._lock:
+            self._open_locked()
+            row = self._conn.execute(
+                "SELECT id, payload, serve_count FROM problem_cache "
+                "WHERE cache_key = ? AND created_at >= ? ORDER BY RANDOM() LIMIT 1",
+                (cache_key, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            row_id, payload, serve_count = row
+            if serve_count + 1 >= self.variety:
+                self._conn.execute("DELETE FROM problem_cache WHERE id = ?", (row_id,))
+            else:
+                self._conn.execute(
+                    "UPDATE problem_cache SET serve_count = serve_count + 1, last_used_at = ? WHERE id = ?",
+                    (now, row_id),
+                )
+            self._conn.commit()
+            self._hits += 1
+        return json.loads(payload)
+
+    def put(self, keyword: str, prompt_text: str, model: str, temperature: float, problem: dict):
+        if not problem:
+            return
+        cache_key = make_cache_key(keyword, prompt_text, model, temperature)
+        payload = json.dumps(problem, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._open_locked()
+            self._conn.execute(
+                "INSERT INTO problem_cache "
+                "(cache_key, keyword, display_keyword, payload, size, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, normalize_keyword(keyword), " ".join(keyword.split()), payload, size, now, now),
+            )
+            self._conn.execute("DELETE FROM problem_cache WHERE created_at < ?", (now - self.ttl,))
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM problem_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # 최근 사용 순으로 누적 크기가 max_bytes 이내인 문제만 남긴다
+        self._conn.execute('''
+            DELETE FROM problem_cache WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, SUM(size) OVER (ORDER BY last_used_at DESC, id DESC) AS running
+                    FROM problem_cache
+                ) WHERE running > ?
+            )
+        ''', (self.max_bytes,))
+        logging.info(f"[ProblemCache] evicted entries over {self.max_bytes} bytes")
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._open_locked()
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM problem_cache"
+            ).fetchone()
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+            "variety": self.variety,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,152 @@
+import heapq
+import json
+import logging
+import os
+import time
+import uuid
+from typing import List, Optional
+
+SCORES_LOG_PATH = "data/scores.jsonl"
+LEGACY_SCORES_PATH = "data/scores.json"
+
+
+def is_ranked(record: dict) -> bool:
+    """
+    순위에 들어가는 기록인지 (시간이 있고 모든 오류를 찾은 게임, Leaderboard와 같은 기준)
+    """
+    return record.get("time") is not None and record.get("correct_count") == record.get("total_errors")
+
+
+class ScoreLog:
+    """
+    게임 기록 저장소 (append-only JSONL)
+
+    - append(): 한 게임 기록을 한 줄로 추가 (전체 파일을 다시 쓰지 않음)
+    - 각 기록은 고유 id를 가지며, 읽을 때 id 기준으로 중복 제거
+    - compact_every 건을 추가할 때마다 compact()로 파일을 정리 (임시 파일에 쓴 뒤 교체)
+      깨진 줄·중복 id·순위에 들지 않는 게임(오류를 다 찾지 못한 기록)을 버리고,
+      기록이 max_records개를 넘으면 최근 max_records개와 전체/키워드별 상위 keep_top개만 남긴다.
+    - migrate_legacy(): 기존 scores.json(JSON 배열)을 중복 제거 후 한 번만 옮긴다
+    """
+
+    def __init__(self, path: str = SCORES_LOG_PATH, compact_every: int = 100,
+                 max_records: int = 5000, keep_top: int = 10):
+        self.path = path
+        self.compact_every = compact_every
+        self.max_records = max_records
+        self.keep_top = keep_top
+        self._appended_since_compact = 0
+
+    def append(self, keyword: str, elapsed_time: float, correct_count: int, total_errors: int) -> dict:
+        record = {
+            "id": uuid.uuid4().hex,
+            "keyword": keyword,
+            "time": elapsed_time,
+            "correct_count": correct_count,
+            "total_errors": total_errors,
+            "recorded_at": time.time(),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        self._appended_since_compact += 1
+        if self._appended_since_compact >= self.compact_every:
+            self.compact()
+        return record
+
+    def iter_records(self):
+        """
+        파일을 한 줄씩 읽어 기록을 돌려준다. (깨진 줄과 중복 id는 건너뜀)
+        """
+        seen = set()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    record_id = record.get("id")
+                    if record_id in seen:
+                        continue
+                    seen.add(record_id)
+                    yield record
+        except FileNotFoundError:
+            return
+
+    def load(self) -> List[dict]:
+        return list(self.iter_records())
+
+    def compact(self):
+        records = [record for record in self.load() if is_ranked(record)]
+        if len(records) > self.max_records:
+            records = self._retain(records)
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                line_count = sum(1 for line in f if line.strip())
+        except FileNotFoundError:
+            return
+        if line_count == len(records):
+            # 정리할 줄이 없으면 파일을 그대로 둔다 (인덱스 offset 유지)
+            self._appended_since_compact = 0
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._appended_since_compact = 0
+        logging.info(f"[ScoreLog] compacted {line_count} -> {len(records)} records")
+
+    def _retain(self, records: List[dict]) -> List[dict]:
+        """
+        최근 max_records개와 전체/키워드별 상위 keep_top개 기록만 남긴다. (파일 순서 유지)
+        """
+        keep = {id(record) for record in records[-self.max_records:]}
+        by_keyword = {}
+        for record in records:
+            by_keyword.setdefault(record.get("keyword") or "", []).append(record)
+        for group in [records, *by_keyword.values()]:
+            fastest = heapq.nsmallest(self.keep_top, group, key=lambda record: record["time"])
+            keep.update(id(record) for record in fastest)
+        return [record for record in records if id(record) in keep]
+
+    def migrate_legacy(self, legacy_path: str = LEGACY_SCORES_PATH) -> Optional[int]:
+        """
+        scores.json의 기록을 중복 제거하여 JSONL 로그로 옮기고, 원본은 .migrated로 이름을 바꾼다.
+        옮길 파일이 없으면 None.
+        """
+        if not os.path.exists(legacy_path):
+            return None
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except json.JSONDecodeError as e:
+            logging.error(f"[ScoreLog] legacy scores unreadable: {e}")
+            return None
+
+        unique = []
+        seen = set()
+        for item in legacy if isinstance(legacy, list) else []:
+            key = json.dumps(item, sort_keys=True, ensure_ascii=False)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(item)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for item in unique:
+                record = {"id": uuid.uuid4().hex, **item}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(legacy_path, legacy_path + ".migrated")
+        logging.info(f"[ScoreLog] migrated {len(unique)} of {len(legacy)} legacy records")
+        return len(unique)
@@ -0,0 +1,51 @@
+"""
+백엔드와 같이 쓰는 모듈을 백엔드(find-hallucination-back)에서 클라이언트로 복사하거나, 서로 다른지 검사한다.
+
+    cd find-hallucination
+    python sync_shared.py           # 백엔드 파일을 클라이언트로 복사
+    python sync_shared.py --check   # 내용이 다르면 exit code 1 (CI에서 그대로 사용)
+
+두 프로젝트는 각자 자기 디렉터리에서 실행되는 평평한 모듈 구조라서 같은 파일을 복사해 둔다.
+원본은 항상 백엔드 쪽이며, 수정도 백엔드에서 한 뒤 이 스크립트로 복사한다.
+"""
+import argparse
+import filecmp
+import os
+import shutil
+import sys
+
+CLIENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(os.path.dirname(CLIENT_DIR), "find-hallucination-back")
+
+SHARED_MODULES = [
+    "llm_providers.py",
+    "problem_cache.py",
+]
+
+
+def out_of_sync() -> list:
+    return [
+        name for name in SHARED_MODULES
+        if not os.path.exists(os.path.join(CLIENT_DIR, name))
+        or not filecmp.cmp(os.path.join(BACKEND_DIR, name), os.path.join(CLIENT_DIR, name), shallow=False)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 공유 모듈을 클라이언트로 복사/검사")
+    parser.add_argument("--check", action="store_true", help="복사하지 않고 다른 파일만 출력")
+    args = parser.parse_args()
+
+    changed = out_of_sync()
+    if args.check:
+        for name in changed:
+            print(f"out of sync: {name} (python sync_shared.py 로 백엔드에서 복사)")
+        sys.exit(1 if changed else 0)
+
+    for name in changed:
+        shutil.copyfile(os.path.join(BACKEND_DIR, name), os.path.join(CLIENT_DIR, name))
+        print(f"copied: {name}")
+
+
+if __name__ == "__main__":
+    main()
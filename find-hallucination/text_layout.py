@@ -0,0 +1,124 @@
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+# 닫는 문장부호는 줄 첫머리에 오지 않도록 앞 글자와 붙여서 자른다
+NO_LINE_START = set(".,!?;:)]}」』”’'\"…")
+
+
+def is_hangul(text: str) -> bool:
+    return any("가" <= ch <= "힣" or "ㄱ" <= ch <= "ㆎ" for ch in text)
+
+
+class TextLayout:
+    """
+    폰트 하나에 대한 줄바꿈 엔진.
+
+    - 단어/글자 단위 폭(advance)을 메모이즈하고, 줄 폭은 누적 합으로 계산 (문장 길이에 선형)
+    - 공백 기준으로 줄바꿈하되, 한글 단어는 음절 단위로 나눠 남은 공간을 채울 수 있다
+    - 한 줄보다 긴 단어는 언어와 상관없이 글자 단위로 나눈다
+    - (문장, 폭, 옵션)별 결과를 LRU로 캐시
+    """
+
+    def __init__(self, font, max_cache: int = 2048):
+        self.font = font
+        self.max_cache = max_cache
+        self._advances: Dict[str, int] = {}
+        self._layouts: "OrderedDict[Tuple[str, int, bool], Tuple[str, ...]]" = OrderedDict()
+        self.space_width = self.advance(" ")
+
+    def advance(self, text: str) -> int:
+        width = self._advances.get(text)
+        if width is None:
+            width = self.font.size(text)[0]
+            self._advances[text] = width
+        return width
+
+    def wrap(self, sentence: str, max_width: int, break_hangul: bool = True) -> List[str]:
+        key = (sentence, max_width, break_hangul)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return list(lines)
+
+        lines = tuple(self._wrap(sentence, max_width, break_hangul))
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_cache:
+            self._layouts.popitem(last=False)
+        return list(lines)
+
+    def _wrap(self, sentence: str, max_width: int, break_hangul: bool) -> List[str]:
+        lines = []
+        current = []
+        current_width = 0
+
+        for word in sentence.split():
+            gap = self.space_width if current else 0
+            word_width = self.advance(word)
+            if current_width + gap + word_width <= max_width:
+                current.append(word)
+                current_width += gap + word_width
+                continue
+
+            if word_width <= max_width and not (break_hangul and is_hangul(word)):
+                # 일반 단어: 다음 줄로 넘김
+                lines.append(" ".join(current))
+                current = [word]
+                current_width = word_width
+                continue
+
+            # 글자 단위로 나눠 남은 공간부터 채운다
+            rest = word
+            while rest:
+                gap = self.space_width if current else 0
+                count = self._fit_chars(rest, max_width - current_width - gap)
+                if count == 0:
+                    if current:
+                        lines.append(" ".join(current))
+                        current = []
+                        current_width = 0
+                        continue
+                    count = 1  # 한 글자도 안 들어가는 폭이면 한 글자씩
+                if count == len(rest):
+                    current.append(rest)
+                    current_width += gap + self.advance(rest)
+                    break
+                piece, rest = rest[:count], rest[count:]
+                current.append(piece)
+                lines.append(" ".join(current))
+                current = []
+                current_width = 0
+
+        if current:
+            lines.append(" ".join(current))
+        return lines
+
+    def _fit_chars(self, text: str, available: int) -> int:
+        """
+        available 폭에 들어가는 앞 글자 수 (줄 첫머리에 문장부호가 오지 않도록 보정)
+        """
+        width = 0
+        count = 0
+        for ch in text:
+            width += self.advance(ch)
+            if width > available:
+                break
+            count += 1
+        if count == len(text):
+            return count
+        while 0 < count < len(text) and text[count] in NO_LINE_START:
+            count -= 1
+        return count
+
+
+_layouts: Dict[int, TextLayout] = {}
+
+
+def get_layout(font) -> TextLayout:
+    """
+    폰트별 TextLayout (폭/레이아웃 캐시를 폰트 단위로 공유)
+    """
+    layout = _layouts.get(id(font))
+    if layout is None or layout.font is not font:
+        layout = TextLayout(font)
+        _layouts[id(font)] = layout
+    return layout